@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import re
+import sys
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
+
+from .normalization import KEY_NORMALIZER, KeyNormalizer
+from .search_engines import UNSPACED_RANGES
+from .term_index import TermIndex
+
+UNSPACED_CLASS = "".join(f"{low}-{high}" for low, high in UNSPACED_RANGES)
+TOKEN_PATTERN = re.compile(rf"[{UNSPACED_CLASS}]|(?:(?![{UNSPACED_CLASS}])\w)+|[^\w\s]")
+DOCUMENT_SUFFIXES = {".txt", ".docx"}
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def tokenize(
+    text: str, normalizer: KeyNormalizer = KEY_NORMALIZER, keys: Optional[Dict[str, str]] = None
+) -> Iterator[Tuple[str, int, int]]:
+    """Word runs, single characters of unspaced scripts and punctuation marks, each with its key.
+
+    ``keys`` memoizes token keys and may be shared between calls.
+    """
+    keys = {} if keys is None else keys
+    for match in TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        key = keys.get(token)
+        if key is None:
+            key = keys[token] = normalizer.token(token)
+        if key:
+            yield key, match.start(), match.end()
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over the token sequences of glossary terms.
+
+    Working on word and punctuation tokens instead of characters keeps the
+    automaton small for 100k+ terms and makes whole-word semantics free: a
+    pattern can only start and end on token boundaries, and characters of
+    unspaced scripts are tokens of their own. Multi-token candidates are
+    then checked against the normalized key so whitespace inside a term
+    still has to match.
+    """
+
+    def __init__(
+        self, sources: Sequence[Tuple[str, TermIndex]], normalizer: KeyNormalizer = KEY_NORMALIZER
+    ) -> None:
+        self.normalizer = normalizer
+        self.patterns: List[Tuple[str, str]] = []
+        self.sources: List[List[str]] = []
+        self.lengths: List[int] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.output: List[Tuple[int, ...]] = [()]
+        seen: Dict[str, int] = {}
+        token_keys: Dict[str, str] = {}
+        for source, index in sources:
+            for key, term in zip(index.keys, index.terms):
+                pattern = seen.get(key)
+                if pattern is not None:
+                    if source not in self.sources[pattern]:
+                        self.sources[pattern].append(source)
+                    continue
+                tokens = [token for token, _, _ in tokenize(term, normalizer, token_keys)]
+                if not tokens:
+                    continue
+                seen[key] = pattern = len(self.patterns)
+                self.patterns.append((term, key))
+                self.sources.append([source])
+                self.lengths.append(len(tokens))
+                self._insert(tokens, pattern)
+        self.fail, self.next_output = self._link()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size; walks every node, so callers should cache it.
+
+        Term and key strings are shared with the term indexes and not counted.
+        """
+        nodes = sum(map(sys.getsizeof, self.goto)) + sum(sys.getsizeof(hits) for hits in self.output if hits)
+        patterns = sum(map(sys.getsizeof, self.patterns)) + sum(map(sys.getsizeof, self.sources))
+        lists = (self.goto, self.output, self.fail, self.next_output, self.patterns, self.sources, self.lengths)
+        node_ids = sys.getsizeof(len(self.goto)) * len(self.goto)
+        return nodes + patterns + sum(map(sys.getsizeof, lists)) + node_ids
+
+    def _insert(self, tokens: List[str], pattern: int) -> None:
+        node = 0
+        for token in tokens:
+            child = self.goto[node].get(token)
+            if child is None:
+                child = len(self.goto)
+                self.goto[node][token] = child
+                self.goto.append({})
+                self.output.append(())
+            node = child
+        self.output[node] += (pattern,)
+
+    def _link(self) -> Tuple[List[int], List[int]]:
+        goto, output = self.goto, self.output
+        fail = [0] * len(goto)
+        next_output = [-1] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for token, child in goto[node].items():
+                state = fail[node]
+                while state and token not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(token, 0)
+                fail[child] = target if target != child else 0
+                link = fail[child]
+                next_output[child] = link if output[link] else next_output[link]
+                queue.append(child)
+        return fail, next_output
+
+    def scan(self, text: str) -> List[Tuple[int, int, int]]:
+        """Return ``(pattern, start, end)`` for every term occurrence, ordered by end then length."""
+        goto, fail, output, next_output = self.goto, self.fail, self.output, self.next_output
+        lengths, patterns, normalizer = self.lengths, self.patterns, self.normalizer
+        starts: List[int] = []
+        hits = []
+        node = 0
+        for token, start, end in tokenize(text, normalizer):
+            starts.append(start)
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            state = node if output[node] else next_output[node]
+            while state > 0:
+                for pattern in output[state]:
+                    length = lengths[pattern]
+                    first = starts[len(starts) - length]
+                    if length == 1 or normalizer(text[first:end]) == patterns[pattern][1]:
+                        hits.append((pattern, first, end))
+                state = next_output[state]
+        return hits
+
+
+def read_document(filename: str, data: bytes, encoding: str) -> str:
+    suffix = Path(filename).suffix.lower()
+    if suffix == ".docx":
+        return read_docx(data)
+    if suffix == ".txt":
+        return data.decode(encoding, errors="replace")
+    raise ValueError(f"Unsupported document type '{suffix or 'none'}'.")
+
+
+def read_docx(data: bytes) -> str:
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as exc:
+        raise ValueError("The Word document could not be read.") from exc
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{WORD_NAMESPACE}t" and node.text:
+                parts.append(node.text)
+            elif node.tag == f"{WORD_NAMESPACE}tab":
+                parts.append("\t")
+            elif node.tag in (f"{WORD_NAMESPACE}br", f"{WORD_NAMESPACE}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    return "\n".join(paragraphs)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+
+MAX_EDITS = 2
+START_MARK = "\x02"
+END_MARK = "\x03"
+CODE_BITS = np.uint64(21)
+OWNER_BITS = np.uint64(22)
+
+
+def auto_edits(length: int) -> int:
+    """Edit budget that grows with the query, like Elasticsearch's ``AUTO`` fuzziness."""
+    if length <= 2:
+        return 0
+    if length <= 5:
+        return 1
+    return MAX_EDITS
+
+
+def bigram_codes(text: str) -> np.ndarray:
+    """Distinct bigrams of ``text`` padded with start and end marks, each packed into one integer."""
+    padded = f"{START_MARK}{text}{END_MARK}"
+    points = np.frombuffer(padded.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    codes = np.sort((points[:-1] << CODE_BITS) | points[1:])
+    return codes[_first_of_runs(codes)]
+
+
+def _first_of_runs(values: np.ndarray) -> np.ndarray:
+    first = np.ones(len(values), dtype=bool)
+    first[1:] = values[1:] != values[:-1]
+    return first
+
+
+def bounded_distance(left: str, right: str, limit: int) -> int:
+    """Levenshtein distance, or ``limit + 1`` as soon as it is known to exceed ``limit``."""
+    if abs(len(left) - len(right)) > limit:
+        return limit + 1
+    start = 0
+    while start < len(left) and start < len(right) and left[start] == right[start]:
+        start += 1
+    left, right = left[start:], right[start:]
+    while left and right and left[-1] == right[-1]:
+        left, right = left[:-1], right[:-1]
+    if len(left) > len(right):
+        left, right = right, left
+    if not left:
+        return len(right) if len(right) <= limit else limit + 1
+    previous = list(range(len(right) + 1))
+    for row, char in enumerate(left, 1):
+        current = [row]
+        for column, other in enumerate(right, 1):
+            current.append(
+                min(previous[column] + 1, current[column - 1] + 1, previous[column - 1] + (char != other))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+class FuzzyIndex:
+    """Bigram postings for typo-tolerant lookups over term keys.
+
+    An edit touches at most two bigrams of the padded query, so a key within
+    ``k`` edits shares all but ``2k`` of the query's distinct bigrams. Only
+    keys passing that count filter and a length filter are compared with
+    :func:`bounded_distance`. When the query is too short for the count
+    filter to exclude anything, the length filter alone selects candidates.
+
+    Postings are built with numpy from all keys at once and kept as one
+    array sliced by sorted bigram codes.
+    """
+
+    __slots__ = ("keys", "lengths", "grams", "bounds", "postings")
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        self.keys = keys
+        self.lengths = np.fromiter((len(key) for key in keys), dtype=np.int32, count=len(keys))
+        padded = "".join(f"{START_MARK}{key}{END_MARK}" for key in keys)
+        points = np.frombuffer(padded.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        owners = np.repeat(np.arange(len(keys), dtype=np.uint64), self.lengths.astype(np.int64) + 2)[:-1]
+        within = points[:-1] != ord(END_MARK)
+        codes = ((points[:-1] << CODE_BITS) | points[1:])[within]
+        owners = owners[within]
+        if len(keys) < 1 << int(OWNER_BITS):
+            pairs = np.sort((codes << OWNER_BITS) | owners)
+            pairs = pairs[_first_of_runs(pairs)]
+            codes, owners = pairs >> OWNER_BITS, pairs & np.uint64((1 << int(OWNER_BITS)) - 1)
+        else:
+            order = np.lexsort((owners, codes))
+            codes, owners = codes[order], owners[order]
+            distinct = _first_of_runs(codes)
+            distinct[1:] |= owners[1:] != owners[:-1]
+            codes, owners = codes[distinct], owners[distinct]
+        self.postings = owners.astype(np.int32)
+        starts = np.flatnonzero(_first_of_runs(codes))
+        self.grams = codes[starts]
+        self.bounds = np.append(starts, len(codes)).astype(np.int64)
+
+    @property
+    def nbytes(self) -> int:
+        return self.lengths.nbytes + self.grams.nbytes + self.bounds.nbytes + self.postings.nbytes
+
+    def search(self, needle: str, max_edits: int) -> List[int]:
+        """Positions of keys within ``max_edits`` of ``needle``, in ascending order."""
+        grams = bigram_codes(needle)
+        threshold = len(grams) - 2 * max_edits
+        if threshold > 0:
+            if not len(self.grams):
+                return []
+            slots = np.minimum(np.searchsorted(self.grams, grams), len(self.grams) - 1)
+            slots = slots[self.grams[slots] == grams]
+            if len(slots) < threshold:
+                return []
+            lists = [self.postings[self.bounds[slot] : self.bounds[slot + 1]] for slot in slots.tolist()]
+            counts = np.bincount(np.concatenate(lists), minlength=len(self.keys))
+            candidates = np.flatnonzero(counts >= threshold)
+        else:
+            candidates = np.arange(len(self.keys))
+        candidates = candidates[np.abs(self.lengths[candidates] - len(needle)) <= max_edits]
+        keys = self.keys
+        return [
+            index for index in candidates.tolist() if bounded_distance(keys[index], needle, max_edits) <= max_edits
+        ]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+
+import pandas as pd
+
+from .normalization import KEY_NORMALIZER
+from .table import GlossaryTable
+from .term_index import TermIndex
+
+
+INDEX_BUILDING = "building"
+INDEX_READY = "ready"
+INDEX_FAILED = "failed"
+
+
+def content_key(digest: str, columns: Optional[Sequence[str]] = None) -> str:
+    """Identify a parsed glossary by file content, column selection and key normalization."""
+    wanted = "\n".join(sorted(column.strip() for column in columns or () if column.strip()))
+    return hashlib.sha256(f"{digest}\n{wanted}\n{KEY_NORMALIZER.signature}".encode("utf-8")).hexdigest()
+
+
+@dataclass(eq=False)
+class SharedGlossary:
+    key: str
+    table: GlossaryTable
+    column_indexes: List[Optional[TermIndex]]
+    size_bytes: int
+    memory_bytes: int = 0
+    references: int = 0
+    index_status: str = INDEX_READY
+    scan_keys: Dict[int, Tuple[pd.Series, pd.Series]] = field(default_factory=dict)
+
+    @property
+    def term_index(self) -> TermIndex:
+        """The term column's index; unlike the other columns it is always built at ingest."""
+        return cast(TermIndex, self.column_indexes[0])
+
+    def pending_indexes(self) -> List[int]:
+        """Columns without an index yet, or whose index still uses the stop-gap scan engine."""
+        return [
+            position
+            for position, index in enumerate(self.column_indexes)
+            if index is None or index.needs_engine_upgrade()
+        ]
+
+    @property
+    def index_progress(self) -> float:
+        return 1 - len(self.pending_indexes()) / max(len(self.column_indexes), 1)
+
+
+def glossary_memory(table: GlossaryTable, column_indexes: Sequence[Optional[TermIndex]]) -> int:
+    return table.nbytes + sum(index.memory_bytes() for index in column_indexes if index is not None)
+
+
+class GlossaryCache:
+    """Process-wide parsed glossaries keyed by content hash, shared between sessions.
+
+    Entries nobody references any more stay cached, least recently released
+    first, until :meth:`evict_unreferenced` needs the memory back.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, SharedGlossary] = {}
+        self._unreferenced: "OrderedDict[str, SharedGlossary]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(shared.memory_bytes for shared in self._entries.values())
+
+    def entries(self) -> List[SharedGlossary]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def acquire(self, key: str) -> Optional[SharedGlossary]:
+        with self._lock:
+            shared = self._entries.get(key)
+            if shared is not None:
+                shared.references += 1
+                self._unreferenced.pop(key, None)
+            return shared
+
+    def add(
+        self, key: str, table: GlossaryTable, column_indexes: List[Optional[TermIndex]], size_bytes: int
+    ) -> SharedGlossary:
+        memory_bytes = glossary_memory(table, column_indexes)
+        with self._lock:
+            shared = self._entries.get(key)
+            if shared is None:
+                shared = SharedGlossary(
+                    key=key,
+                    table=table,
+                    column_indexes=column_indexes,
+                    size_bytes=size_bytes,
+                    memory_bytes=memory_bytes,
+                )
+                self._entries[key] = shared
+            shared.references += 1
+            self._unreferenced.pop(key, None)
+            return shared
+
+    def refresh_memory(self, shared: SharedGlossary) -> None:
+        memory_bytes = glossary_memory(shared.table, shared.column_indexes)
+        with self._lock:
+            shared.memory_bytes = memory_bytes
+
+    def release(self, shared: SharedGlossary) -> None:
+        with self._lock:
+            shared.references -= 1
+            if shared.references <= 0 and self._entries.get(shared.key) is shared:
+                self._unreferenced[shared.key] = shared
+
+    def evict_unreferenced(self, budget_bytes: int) -> int:
+        evicted = 0
+        with self._lock:
+            total = sum(shared.memory_bytes for shared in self._entries.values())
+            while total > budget_bytes and self._unreferenced:
+                key, shared = self._unreferenced.popitem(last=False)
+                del self._entries[key]
+                total -= shared.memory_bytes
+                evicted += 1
+        return evicted
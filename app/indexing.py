@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .glossary_cache import SharedGlossary
+from .normalization import KEY_NORMALIZER
+from .search_engines import TrigramEngine, trigram_postings
+from .table import Column
+from .term_index import (
+    MODE_EXACT,
+    MODE_PREFIX,
+    MODE_SUBSTRING,
+    TermIndex,
+    TermIndexBuilder,
+    key_matches,
+    normalize_key,
+)
+
+
+def column_values(column: Column) -> List[Optional[str]]:
+    return [column[row] for row in range(len(column))]
+
+
+def build_column_index(values: List[Optional[str]]) -> TermIndex:
+    builder = TermIndexBuilder()
+    builder.add(pd.Series(values, dtype=object), 0)
+    return builder.build()
+
+
+def column_keys(shared: SharedGlossary, position: int) -> Tuple[pd.Series, pd.Series]:
+    """Display values and keys of an unindexed column, computed once and kept until its index is published."""
+    cached = shared.scan_keys.get(position)
+    if cached is None:
+        values = pd.Series(column_values(shared.table.column(position)), dtype=object).dropna()
+        values = values[values != ""]
+        cached = values, KEY_NORMALIZER.normalize_series(values)
+        if shared.column_indexes[position] is None:
+            shared.scan_keys[position] = cached
+            # The index may have been published, and the cache cleared, in between.
+            if shared.column_indexes[position] is not None:
+                shared.scan_keys.pop(position, None)
+    return cached
+
+
+def scan_column(shared: SharedGlossary, position: int, needle: str, mode: str) -> List[Tuple[str, str]]:
+    """Sorted distinct ``(key, display)`` matches of a column that has no index yet."""
+    values, keys = column_keys(shared, position)
+    if not needle:
+        found = keys.notna()
+    elif mode == MODE_EXACT:
+        found = keys == needle
+    elif mode == MODE_PREFIX:
+        found = keys.str.startswith(needle)
+    elif mode == MODE_SUBSTRING:
+        found = keys.str.contains(needle, regex=False)
+    else:
+        found = keys.map(lambda key: key_matches(key, needle, mode)).astype(bool)
+    return sorted(set(zip(keys[found], values[found])))
+
+
+def scan_rows(shared: SharedGlossary, position: int, term: str) -> np.ndarray:
+    """Rows of an unindexed column whose key equals the key of ``term``."""
+    _, keys = column_keys(shared, position)
+    return keys.index[keys == normalize_key(term)].to_numpy(dtype=np.int64)
+
+
+def complete_indexes(shared: SharedGlossary, executor: Executor) -> None:
+    """Build every pending index of ``shared`` on ``executor``, publishing each as soon as it is ready.
+
+    Readers pick indexes up through ``shared.column_indexes``; until then they
+    fall back to :func:`scan_column` (or the scan engine of the term column),
+    whose cached keys are dropped once the column's index is in place.
+    """
+    for position in shared.pending_indexes():
+        index = shared.column_indexes[position]
+        if index is None:
+            values = column_values(shared.table.column(position))
+            shared.column_indexes[position] = executor.submit(build_column_index, values).result()
+            shared.scan_keys.pop(position, None)
+        else:
+            postings = executor.submit(trigram_postings, index.keys).result()
+            engine = TrigramEngine(index.keys, blob=index.engine.blob, postings=postings)
+            shared.column_indexes[position] = index.with_engine(engine)
+    shared.scan_keys.clear()
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = Lock()
+
+
+def get_index_executor() -> ThreadPoolExecutor:
+    """One coordinating thread; the heavy lifting runs on the parse executor it is handed."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="glossary-index")
+        return _EXECUTOR
+
+
+def shutdown_index_executor() -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            _EXECUTOR = None
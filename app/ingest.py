@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import chardet
+import pandas as pd
+
+from .metrics import StageTimings
+from .table import GlossaryTable, GlossaryTableBuilder
+from .term_index import TermIndex, TermIndexBuilder
+
+PARSE_EXECUTOR_KIND = os.environ.get("GLOSSARY_PARSE_EXECUTOR", "process")
+PARSE_WORKERS = int(os.environ.get("GLOSSARY_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+ENCODING_SAMPLE_SIZE = 64 * 1024
+DELIMITER_SAMPLE_SIZE = 4096
+CSV_CHUNK_ROWS = int(os.environ.get("GLOSSARY_CSV_CHUNK_ROWS", "50000"))
+CSV_SUFFIXES = {".csv"}
+EXCEL_SUFFIXES = {".xlsx", ".xls"}
+BYTE_ORDER_MARKS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def detect_encoding(sample: bytes) -> str:
+    for mark, encoding in BYTE_ORDER_MARKS:
+        if sample.startswith(mark):
+            return encoding
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    encoding = chardet.detect(sample).get("encoding") or "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return "utf-8"
+    return encoding
+
+
+def detect_csv_delimiter(sample: str) -> str:
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=[",", ";", "\t"])
+        return dialect.delimiter
+    except csv.Error:
+        return ","
+
+
+def column_filter(columns: Optional[Sequence[str]]) -> Optional[Callable[[object], bool]]:
+    if not columns:
+        return None
+    wanted = {column.strip() for column in columns if column.strip()}
+    return lambda column: str(column).strip() in wanted
+
+
+def read_csv_chunks(
+    path: str, columns: Optional[Sequence[str]] = None, engine: str = "c", timings: Optional[StageTimings] = None
+) -> Iterator[pd.DataFrame]:
+    timings = StageTimings() if timings is None else timings
+    with timings.measure("detect_encoding"):
+        with open(path, "rb") as handle:
+            sample = handle.read(ENCODING_SAMPLE_SIZE)
+        encoding = detect_encoding(sample)
+        delimiter = detect_csv_delimiter(sample[:DELIMITER_SAMPLE_SIZE].decode(encoding, errors="ignore"))
+    with pd.read_csv(
+        path,
+        sep=delimiter,
+        encoding=encoding,
+        encoding_errors="replace",
+        usecols=column_filter(columns),
+        dtype=str,
+        engine=engine,
+        chunksize=CSV_CHUNK_ROWS,
+    ) as reader:
+        chunks = iter(reader)
+        while True:
+            with timings.measure("read_csv"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+def read_excel(path: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    return pd.read_excel(path, engine="openpyxl", usecols=column_filter(columns))
+
+
+def is_supported(filename: str) -> bool:
+    return Path(filename).suffix.lower() in CSV_SUFFIXES | EXCEL_SUFFIXES
+
+
+def normalize_column(series: pd.Series) -> pd.Series:
+    present = series.notna()
+    if series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+        text = series.astype(str)
+    else:
+        text = series.map(str, na_action="ignore")
+    text = text.str.replace("_x000D_", "\n", regex=False).str.strip()
+    return text.astype(object).where(present, None)
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame(
+        {column: normalize_column(df[column]) for column in df.columns},
+        index=pd.RangeIndex(len(df)),
+    )
+
+
+@dataclass
+class ParsedGlossary:
+    table: GlossaryTable
+    column_indexes: List[Optional[TermIndex]]
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def build_parsed_glossary(
+    frames: Iterable[pd.DataFrame], timings: Optional[StageTimings] = None
+) -> ParsedGlossary:
+    """Encode the table and index its term column with the scan engine.
+
+    The remaining column indexes, and the trigram engine for large term
+    columns, are left to :mod:`.indexing` so the upload can return first.
+    """
+    timings = StageTimings() if timings is None else timings
+    index_builder = TermIndexBuilder()
+    table_builder = GlossaryTableBuilder()
+    for frame in frames:
+        with timings.measure("normalize"):
+            frame = normalize_frame(frame.reset_index(drop=True))
+        with timings.measure("encode_table"):
+            if frame.shape[1]:
+                index_builder.add(frame.iloc[:, 0], table_builder.row_count)
+            table_builder.add(frame)
+    if not table_builder.row_count or not table_builder.columns:
+        raise ValueError("The file contains no rows.")
+    with timings.measure("encode_table"):
+        table = table_builder.build()
+    with timings.measure("build_index"):
+        term_index = index_builder.build(kind="scan")
+    column_indexes: List[Optional[TermIndex]] = [term_index] + [None] * (len(table.columns) - 1)
+    return ParsedGlossary(table=table, column_indexes=column_indexes, timings=dict(timings))
+
+
+def parse_glossary(filename: str, path: str, columns: Optional[List[str]] = None) -> ParsedGlossary:
+    suffix = Path(filename).suffix.lower()
+    timings = StageTimings()
+    if suffix in CSV_SUFFIXES:
+        try:
+            return build_parsed_glossary(read_csv_chunks(path, columns, engine="c", timings=timings), timings)
+        except pd.errors.ParserError:
+            timings.clear()
+            return build_parsed_glossary(read_csv_chunks(path, columns, engine="python", timings=timings), timings)
+    if suffix in EXCEL_SUFFIXES:
+        with timings.measure("read_excel"):
+            frame = read_excel(path, columns)
+        return build_parsed_glossary([frame], timings)
+    raise ValueError(f"Unsupported file type '{suffix or 'none'}'.")
+
+
+_EXECUTOR: Optional[Executor] = None
+_EXECUTOR_LOCK = Lock()
+
+
+def get_parse_executor() -> Executor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            if PARSE_EXECUTOR_KIND == "process" and PARSE_WORKERS > 1:
+                _EXECUTOR = ProcessPoolExecutor(
+                    max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="glossary-parse")
+        return _EXECUTOR
+
+
+def shutdown_parse_executor() -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+            _EXECUTOR = None
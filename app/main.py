@@ -1,81 +1,511 @@
 from __future__ import annotations
 
-import csv
+import asyncio
+import hashlib
+import heapq
+import json
+import logging
 import os
-import re
+import sys
+import tempfile
+import time
 import uuid
-from dataclasses import dataclass, field
-from io import BytesIO
+from contextlib import asynccontextmanager, suppress
+from functools import cached_property
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from threading import Lock
-from typing import Dict, List, Optional
+from threading import Lock, Thread
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
-import chardet
-import pandas as pd
-from fastapi import Depends, FastAPI, File, HTTPException, Request, Response, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import Body, Depends, FastAPI, File, Form, HTTPException, Query, Request, Response, UploadFile
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+
+from .extract import DOCUMENT_SUFFIXES, TermMatcher, read_document
+from .fuzzy import MAX_EDITS
+from .glossary_cache import INDEX_BUILDING, INDEX_FAILED, INDEX_READY, GlossaryCache, SharedGlossary, content_key
+from .indexing import complete_indexes, get_index_executor, scan_column, scan_rows, shutdown_index_executor
+from .metrics import (
+    REQUEST_SECONDS,
+    STAGE_SECONDS,
+    MetricsMiddleware,
+    record_stage,
+    render_gauges,
+    timed,
+)
+from .ingest import (
+    ENCODING_SAMPLE_SIZE,
+    ParsedGlossary,
+    detect_encoding,
+    get_parse_executor,
+    is_supported,
+    parse_glossary,
+    shutdown_parse_executor,
+)
+from .result_cache import ResultCache
+from .sessions import build_session_backend
+from .store import GlossaryStore
+from .table import GlossaryTable
+from .term_index import (
+    MODE_PREFIX,
+    MODE_SUBSTRING,
+    TermIndex,
+    by_distance,
+    fuzzy_edits,
+    normalize_key,
+    query_mode,
+    top_ranked,
+)
+
+BASE_DIR = Path(__file__).resolve().parent
+FRONTEND_DIR = BASE_DIR.parent / "frontend"
+GLOSSARY_STORE_DIR = os.environ.get("GLOSSARY_STORE_DIR", str(BASE_DIR.parent / "glossary_store"))
 
 SESSION_COOKIE = "glossary_session_id"
 SESSION_STORE: Dict[str, "SessionState"] = {}
 SESSION_LOCK = Lock()
+INDEX_LOCK = Lock()
+GLOSSARY_CACHE = GlossaryCache()
+PARSES_IN_FLIGHT: Dict[str, "asyncio.Future[ParsedGlossary]"] = {}
+GLOSSARY_STORE = GlossaryStore(GLOSSARY_STORE_DIR) if GLOSSARY_STORE_DIR else None
+SESSION_BACKEND = build_session_backend(os.environ.get("GLOSSARY_SESSION_BACKEND", "auto"), GLOSSARY_STORE_DIR)
 
 
 LARGE_GLOSSARY_LIMIT = 10000
+REFINE_MAX_CANDIDATES = 50000
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 5000
+EXPORT_CHUNK_SIZE = 1000
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+GZIP_MIN_BYTES = 1024
+MAX_BATCH_TERMS = 100000
+MAX_BATCH_FILE_BYTES = 16 * 1024 * 1024
+MAX_DOCUMENT_BYTES = 16 * 1024 * 1024
+UPLOAD_SPOOL_DIR = os.environ.get("GLOSSARY_UPLOAD_DIR") or None
+MAX_UPLOAD_BYTES = int(os.environ.get("GLOSSARY_MAX_UPLOAD_MB", "200")) * 1024 * 1024
+MAX_SESSION_UPLOAD_BYTES = int(os.environ.get("GLOSSARY_MAX_SESSION_MB", "500")) * 1024 * 1024
+SESSION_TTL_SECONDS = int(os.environ.get("GLOSSARY_SESSION_TTL_SECONDS", str(60 * 60 * 24)))
+MEMORY_BUDGET_BYTES = int(os.environ.get("GLOSSARY_MEMORY_BUDGET_MB", "2048")) * 1024 * 1024
+SESSION_SWEEP_INTERVAL = 60.0
+SESSION_SAVE_ATTEMPTS = 5
+STORE_GC_INTERVAL = float(os.environ.get("GLOSSARY_STORE_GC_SECONDS", "3600"))
+STORE_GC_MIN_AGE = 60.0 * 60.0
+EVICTION_STATS: Dict[str, int] = {
+    "sessions_expired": 0,
+    "sessions_evicted": 0,
+    "glossaries_evicted": 0,
+    "stored_glossaries_removed": 0,
+}
+RESULT_CACHE_BYTES = int(os.environ.get("GLOSSARY_RESULT_CACHE_MB", "128")) * 1024 * 1024
+DETAILS_CACHE_BYTES = int(os.environ.get("GLOSSARY_DETAILS_CACHE_MB", "64")) * 1024 * 1024
+# A cached match costs its tuple and list slot; the strings belong to the term indexes.
+MATCH_BYTES = sys.getsizeof(("", "")) + 8
+MATCH_CACHE: "ResultCache[List[Tuple[str, str]]]" = ResultCache(
+    RESULT_CACHE_BYTES, weigh=lambda matches: sys.getsizeof(matches) + MATCH_BYTES * len(matches)
+)
+DETAILS_CACHE: "ResultCache[List[Dict[str, object]]]" = ResultCache(
+    DETAILS_CACHE_BYTES, weigh=lambda results: details_bytes(results)
+)
+MATCHER_CACHE_BYTES = int(os.environ.get("GLOSSARY_MATCHER_CACHE_MB", "256")) * 1024 * 1024
+MATCHER_CACHE: "ResultCache[TermMatcher]" = ResultCache(MATCHER_CACHE_BYTES, weigh=TermMatcher.memory_bytes)
 
+logger = logging.getLogger(__name__)
+_last_sweep = 0.0
+_last_store_gc = 0.0
 
-@dataclass
+
+@dataclass(frozen=True)
 class Glossary:
     id: str
     filename: str
     display_name: str
-    dataframe: pd.DataFrame
-    term_column: str
+    shared: SharedGlossary
     selected: bool = True
-    preload_terms: bool = True
+
+    @property
+    def table(self) -> GlossaryTable:
+        return self.shared.table
+
+    @property
+    def term_index(self) -> TermIndex:
+        return self.shared.term_index
+
+    @property
+    def term_column(self) -> str:
+        return self.shared.table.columns[0]
+
+    def column_position(self, column: Optional[str]) -> Optional[int]:
+        """Position of ``column``, the term column when no column is named, or None if the glossary lacks it."""
+        if not column:
+            return 0
+        try:
+            return self.shared.table.columns.index(column)
+        except ValueError:
+            return None
+
+    @property
+    def preload_terms(self) -> bool:
+        return self.shared.table.row_count <= LARGE_GLOSSARY_LIMIT
+
+    @property
+    def size_bytes(self) -> int:
+        return self.shared.size_bytes
+
+
+@dataclass
+class TermQuery:
+    version: int
+    column: Optional[str]
+    needle: str
+    mode: str
+    matches: List[Tuple[str, str]]
+
+    def matches_query(self, version: int, column: Optional[str], needle: str, mode: str) -> bool:
+        return (version, column, needle, mode) == (self.version, self.column, self.needle, self.mode)
+
+    def can_refine(self, version: int, column: Optional[str], needle: str, mode: str) -> bool:
+        if version != self.version or column != self.column or mode != self.mode or not self.needle:
+            return False
+        if len(self.matches) > REFINE_MAX_CANDIDATES:
+            return False
+        if mode == MODE_PREFIX:
+            return needle.startswith(self.needle)
+        return mode == MODE_SUBSTRING and self.needle in needle
+
+
+@dataclass(frozen=True)
+class SessionSnapshot:
+    version: int = 0
+    glossaries: Tuple[Glossary, ...] = ()
+
+    @cached_property
+    def selected_keys(self) -> Tuple[str, ...]:
+        return tuple(sorted({glossary.shared.key for glossary in self.glossaries if glossary.selected}))
+
+    @cached_property
+    def selected_sources(self) -> Tuple[Tuple[str, str], ...]:
+        return tuple(
+            (glossary.shared.key, glossary.display_name) for glossary in self.glossaries if glossary.selected
+        )
 
 
 @dataclass
 class SessionState:
-    glossaries: List[Glossary] = field(default_factory=list)
+    """Per-user state; readers take ``snapshot`` once and never lock.
 
+    Writers hold ``lock`` and publish a new immutable snapshot, so a search
+    running concurrently with an upload sees either the old or the new
+    glossary set, never a half-updated one.
+    """
 
-BASE_DIR = Path(__file__).resolve().parent
-FRONTEND_DIR = BASE_DIR.parent / "frontend"
+    id: str = ""
+    snapshot: SessionSnapshot = field(default_factory=SessionSnapshot)
+    last_access: float = field(default_factory=time.monotonic)
+    last_query: Optional[TermQuery] = None
+    revision: int = 0
+    touched_at: float = 0.0
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    @property
+    def glossaries(self) -> Tuple[Glossary, ...]:
+        return self.snapshot.glossaries
+
+    def publish(self, glossaries: Iterable[Glossary]) -> None:
+        self.snapshot = SessionSnapshot(version=self.snapshot.version + 1, glossaries=tuple(glossaries))
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    shutdown_index_executor()
+    shutdown_parse_executor()
 
-app = FastAPI(title="Glossary Lookup Tool")
+
+class TimedJSONResponse(JSONResponse):
+    """JSON response whose encoding is recorded as the ``serialize`` stage."""
+
+    def render(self, content: object) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
+
+
+app = FastAPI(title="Glossary Lookup Tool", lifespan=lifespan, default_response_class=TimedJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES)
+app.add_middleware(MetricsMiddleware)
 app.mount("/static", StaticFiles(directory=str(FRONTEND_DIR)), name="static")
 
 
-def detect_csv_delimiter(content: bytes) -> str:
-    sample = content[:4096]
-    encoding = chardet.detect(sample).get("encoding") or "utf-8"
+def load_stored_glossary(key: str) -> Optional[ParsedGlossary]:
+    if GLOSSARY_STORE is None:
+        return None
     try:
-        decoded_sample = sample.decode(encoding, errors="ignore")
-    except (LookupError, UnicodeDecodeError):
-        decoded_sample = sample.decode("utf-8", errors="ignore")
+        with timed("store_load"):
+            stored = GLOSSARY_STORE.load_glossary(key)
+    except (OSError, ValueError):
+        logger.exception("Could not read the stored copy of glossary %s", key)
+        return None
+    if stored is None:
+        return None
+    table, column_indexes, _ = stored
+    return ParsedGlossary(table=table, column_indexes=column_indexes)
+
+
+def acquire_glossary(key: str) -> Optional[SharedGlossary]:
+    shared = GLOSSARY_CACHE.acquire(key)
+    if shared is not None or GLOSSARY_STORE is None:
+        return shared
+    with timed("store_load"):
+        stored = GLOSSARY_STORE.load_glossary(key)
+    if stored is None:
+        return None
+    shared = GLOSSARY_CACHE.add(key, *stored)
+    ensure_indexed(shared)
+    return shared
+
 
+def persist_glossary(shared: SharedGlossary) -> None:
+    if GLOSSARY_STORE is None:
+        return
     try:
-        dialect = csv.Sniffer().sniff(decoded_sample, delimiters=[",", ";", "\t"])
-        return dialect.delimiter
-    except csv.Error:
-        return ","
+        with timed("store_save"):
+            GLOSSARY_STORE.save_glossary(shared.key, shared.table, shared.column_indexes, shared.size_bytes)
+    except OSError:
+        logger.exception("Could not persist glossary %s", shared.key)
+
+
+def ensure_indexed(shared: SharedGlossary) -> None:
+    """Start building the indexes ingest left out, unless that already happened or failed."""
+    with INDEX_LOCK:
+        if shared.index_status != INDEX_READY or not shared.pending_indexes():
+            return
+        shared.index_status = INDEX_BUILDING
+    get_index_executor().submit(build_pending_indexes, shared)
+
+
+def build_pending_indexes(shared: SharedGlossary) -> None:
+    try:
+        with timed("background_index"):
+            complete_indexes(shared, get_parse_executor())
+    except Exception:
+        logger.exception("Could not index glossary %s", shared.key)
+        shared.index_status = INDEX_FAILED
+        return
+    GLOSSARY_CACHE.refresh_memory(shared)
+    shared.index_status = INDEX_READY
+    if GLOSSARY_STORE is None:
+        return
+    try:
+        with timed("store_save"):
+            GLOSSARY_STORE.save_indexes(shared.key, shared.column_indexes)
+    except (OSError, ValueError):
+        logger.exception("Could not persist the indexes of glossary %s", shared.key)
+
+
+def persist_session(
+    session: SessionState, change: Callable[[Tuple[Glossary, ...]], Iterable[Glossary]]
+) -> SessionState:
+    """Apply ``change`` to the session's glossaries, then publish and save the result.
+
+    The save only succeeds against the revision this worker last saw. When
+    another worker saved first, the session is re-synced from the backend and
+    ``change`` is applied again to the fresh copy, which is returned.
+    """
+    for _ in range(SESSION_SAVE_ATTEMPTS):
+        with session.lock:
+            glossaries = tuple(change(session.glossaries))
+            manifest = {
+                "glossaries": [
+                    {
+                        "id": glossary.id,
+                        "filename": glossary.filename,
+                        "display_name": glossary.display_name,
+                        "key": glossary.shared.key,
+                        "selected": glossary.selected,
+                    }
+                    for glossary in glossaries
+                ]
+            }
+            revision = SESSION_BACKEND.save(session.id, manifest, session.revision)
+            if revision is not None:
+                session.publish(glossaries)
+                session.revision = revision
+                session.touched_at = time.monotonic()
+                return session
+        fresh = sync_session(session.id, session)
+        if fresh is None or fresh is session:
+            # The stored copy expired or could not be restored; this one starts it over.
+            session.revision = 0
+        else:
+            session = fresh
+    raise HTTPException(status_code=409, detail="The session was changed concurrently; please try again.")
+
+
+def restore_session(session_id: str) -> Optional[SessionState]:
+    """Rebuild a session from the backend manifest, reopening its glossaries from the cache or store."""
+    record = SESSION_BACKEND.load(session_id, SESSION_TTL_SECONDS)
+    if record is None:
+        return None
+    revision, manifest = record
+    glossaries = []
+    for entry in manifest.get("glossaries", []):
+        shared = acquire_glossary(entry["key"])
+        if shared is None:
+            logger.warning("Session %s lost glossary %s: no usable stored copy", session_id, entry["filename"])
+            continue
+        glossaries.append(
+            Glossary(
+                id=entry["id"],
+                filename=entry["filename"],
+                display_name=entry["display_name"],
+                shared=shared,
+                selected=entry["selected"],
+            )
+        )
+    return SessionState(
+        id=session_id,
+        snapshot=SessionSnapshot(glossaries=tuple(glossaries)),
+        revision=revision,
+        touched_at=time.monotonic(),
+    )
+
+
+def sync_session(session_id: str, session: Optional[SessionState]) -> Optional[SessionState]:
+    """Return the freshest copy of a session, reloading it when another worker saved a newer revision."""
+    if session is not None:
+        revision = SESSION_BACKEND.revision(session_id)
+        if revision is None or revision <= session.revision:
+            return session
+    restored = restore_session(session_id)
+    if restored is None:
+        return session
+    with SESSION_LOCK:
+        current = SESSION_STORE.get(session_id)
+        if current is None or current.revision < restored.revision:
+            SESSION_STORE[session_id] = restored
+            stale, current = current, restored
+        else:
+            stale = restored
+    if stale is not None:
+        for glossary in stale.glossaries:
+            GLOSSARY_CACHE.release(glossary.shared)
+    return current
 
 
 def get_session_state(request: Request, response: Response) -> SessionState:
     session_id = request.cookies.get(SESSION_COOKIE)
+    session = SESSION_STORE.get(session_id) if session_id else None
+    if session_id:
+        session = sync_session(session_id, session)
+    if session is None:
+        session = SessionState(id=str(uuid.uuid4()))
+        with SESSION_LOCK:
+            SESSION_STORE[session.id] = session
+    session.last_access = time.monotonic()
+    response.set_cookie(
+        key=SESSION_COOKIE,
+        value=session.id,
+        httponly=True,
+        samesite="lax",
+        max_age=SESSION_TTL_SECONDS,
+    )
+    if session.revision and session.last_access - session.touched_at > SESSION_SWEEP_INTERVAL:
+        session.touched_at = session.last_access
+        SESSION_BACKEND.touch(session.id)
+    sweep_sessions(keep=session.id)
+    return session
+
+
+def _drop_session(session_id: str, forget: bool = False) -> None:
+    session = SESSION_STORE.pop(session_id)
+    for glossary in session.glossaries:
+        GLOSSARY_CACHE.release(glossary.shared)
+    if forget:
+        SESSION_BACKEND.expire(session_id, SESSION_TTL_SECONDS)
+
+
+def collect_store_garbage() -> None:
+    """Delete stored glossaries that no live session manifest and no cached entry refers to."""
+    if GLOSSARY_STORE is None:
+        return
+    referenced = SESSION_BACKEND.glossary_keys(SESSION_TTL_SECONDS)
+    referenced.update(shared.key for shared in GLOSSARY_CACHE.entries())
+    try:
+        with timed("store_gc"):
+            removed = GLOSSARY_STORE.remove_unreferenced(referenced, STORE_GC_MIN_AGE)
+    except OSError:
+        logger.exception("Could not clean up the glossary store")
+        return
+    EVICTION_STATS["stored_glossaries_removed"] += removed
+    if removed:
+        logger.info("Store sweep: %d unreferenced glossaries removed", removed)
+
+
+def glossary_budget() -> int:
+    """What ``MEMORY_BUDGET_BYTES`` leaves for glossaries next to cached matches, details and term matchers."""
+    return max(MEMORY_BUDGET_BYTES - MATCH_CACHE.weight - DETAILS_CACHE.weight - MATCHER_CACHE.weight, 0)
+
+
+def sweep_sessions(keep: Optional[str] = None, force: bool = False) -> None:
+    """Drop sessions idle past the TTL, then least recently used data until under the memory budget.
+
+    Every ``STORE_GC_INTERVAL`` seconds the glossary store is swept as well, on a thread of its own.
+    """
+    global _last_sweep, _last_store_gc
+    now = time.monotonic()
+    if not force and now - _last_sweep < SESSION_SWEEP_INTERVAL:
+        return
     with SESSION_LOCK:
-        if not session_id or session_id not in SESSION_STORE:
-            session_id = str(uuid.uuid4())
-            SESSION_STORE[session_id] = SessionState()
-        response.set_cookie(
-            key=SESSION_COOKIE,
-            value=session_id,
-            httponly=True,
-            samesite="lax",
-            max_age=60 * 60 * 24,
+        if not force and now - _last_sweep < SESSION_SWEEP_INTERVAL:
+            return
+        _last_sweep = now
+        collect_store = now - _last_store_gc >= STORE_GC_INTERVAL
+        if collect_store:
+            _last_store_gc = now
+        expired = [
+            session_id
+            for session_id, session in SESSION_STORE.items()
+            if session_id != keep and now - session.last_access > SESSION_TTL_SECONDS
+        ]
+        for session_id in expired:
+            _drop_session(session_id, forget=True)
+        evicted_sessions = 0
+        budget = glossary_budget()
+        evicted_glossaries = GLOSSARY_CACHE.evict_unreferenced(budget)
+        victims = iter(sorted(SESSION_STORE.values(), key=lambda session: session.last_access))
+        while GLOSSARY_CACHE.memory_bytes > budget:
+            victim = next((session.id for session in victims if session.id != keep), None)
+            if victim is None:
+                break
+            _drop_session(victim)
+            evicted_sessions += 1
+            evicted_glossaries += GLOSSARY_CACHE.evict_unreferenced(budget)
+
+    EVICTION_STATS["sessions_expired"] += len(expired)
+    EVICTION_STATS["sessions_evicted"] += evicted_sessions
+    EVICTION_STATS["glossaries_evicted"] += evicted_glossaries
+    if expired or evicted_sessions or evicted_glossaries:
+        logger.info(
+            "Session sweep: %d expired, %d evicted for memory, %d glossaries evicted",
+            len(expired),
+            evicted_sessions,
+            evicted_glossaries,
         )
-        return SESSION_STORE[session_id]
+    if collect_store:
+        Thread(target=collect_store_garbage, name="glossary-store-gc", daemon=True).start()
 
 
 def summarize_glossary(glossary: Glossary) -> Dict[str, object]:
@@ -83,55 +513,239 @@ def summarize_glossary(glossary: Glossary) -> Dict[str, object]:
         "id": glossary.id,
         "name": glossary.display_name,
         "selected": glossary.selected,
-        "terms_count": int(glossary.dataframe.shape[0]),
+        "terms_count": glossary.table.row_count,
+        "columns": glossary.table.columns,
         "preload_terms": glossary.preload_terms,
+        "index_status": glossary.shared.index_status,
+        "index_progress": round(glossary.shared.index_progress, 2),
     }
 
 
-def normalize_text(value: object) -> Optional[str]:
-    if pd.isna(value):
-        return None
-    text = str(value)
-    return text.replace("_x000D_", "\n").strip()
-
-
-def filter_series(series: pd.Series, term: str, exact: bool, whole_word: bool) -> pd.Series:
-    clean = series.dropna().astype(str)
-    if not term:
-        return clean
-    trimmed = term.strip()
-    if not trimmed:
-        return clean
-    term_lower = trimmed.lower()
-    if exact:
-        return clean[clean.str.lower() == term_lower]
-    if whole_word:
-        pattern = fr"\b{re.escape(trimmed)}\b"
-        return clean[clean.str.contains(pattern, case=False, regex=True)]
-    return clean[clean.str.contains(re.escape(trimmed), case=False, regex=True)]
-
-
-def build_term_list(
-    session: SessionState, search: str, exact: bool, whole_word: bool
-) -> List[str]:
-    terms = set()
-    sanitized_search = search.strip()
-    include_large = bool(sanitized_search)
-    for glossary in session.glossaries:
+def collect_matches(
+    glossaries: Sequence[Glossary], needle: str, mode: str, column: Optional[str] = None
+) -> List[Tuple[str, str]]:
+    streams = []
+    for glossary in glossaries:
         if not glossary.selected:
             continue
-        if not include_large and not glossary.preload_terms:
+        if not needle and not glossary.preload_terms:
+            continue
+        position = glossary.column_position(column)
+        if position is None:
             continue
-        term_series = glossary.dataframe[glossary.term_column]
-        matched = filter_series(term_series, sanitized_search if include_large else "", exact, whole_word)
-        terms.update({value.strip() for value in matched.tolist() if value.strip()})
-    if not search:
-        return sorted(terms, key=str.casefold)
-    return sorted(terms, key=str.casefold)
+        index = glossary.shared.column_indexes[position]
+        if index is None:
+            streams.append(iter(scan_column(glossary.shared, position, needle, mode)))
+        else:
+            had_fuzzy = index.has_fuzzy
+            streams.append(index.iter_sorted(index.search(needle, mode)))
+            if index.has_fuzzy and not had_fuzzy:
+                # The fuzzy index is built lazily, after the glossary's memory was first measured.
+                GLOSSARY_CACHE.refresh_memory(glossary.shared)
 
+    matches: List[Tuple[str, str]] = []
+    previous = None
+    for key, term in heapq.merge(*streams):
+        if term != previous:
+            matches.append((key, term))
+            previous = term
+    max_edits = fuzzy_edits(mode, needle)
+    if needle and max_edits is not None:
+        return by_distance(matches, needle, max_edits)
+    return matches
 
-def find_glossary(session: SessionState, glossary_id: str) -> Glossary:
-    for glossary in session.glossaries:
+
+def find_term_matches(
+    session: SessionState,
+    search: str,
+    mode: str,
+    snapshot: Optional[SessionSnapshot] = None,
+    column: Optional[str] = None,
+) -> List[Tuple[str, str]]:
+    needle = normalize_key(search)
+    column = column or None
+    snapshot = snapshot or session.snapshot
+    version = snapshot.version
+    last_query = session.last_query
+    if last_query is not None and last_query.matches_query(version, column, needle, mode):
+        return last_query.matches
+    cache_key = (snapshot.selected_keys, column, needle, mode)
+    matches = MATCH_CACHE.get(cache_key)
+    if matches is None:
+        if needle and last_query is not None and last_query.can_refine(version, column, needle, mode):
+            with timed("refine"):
+                if mode == MODE_PREFIX:
+                    matches = [match for match in last_query.matches if match[0].startswith(needle)]
+                else:
+                    matches = [match for match in last_query.matches if needle in match[0]]
+        else:
+            with timed("search"):
+                matches = collect_matches(snapshot.glossaries, needle, mode, column)
+        MATCH_CACHE.put(cache_key, matches)
+    session.last_query = TermQuery(version=version, column=column, needle=needle, mode=mode, matches=matches)
+    return matches
+
+
+def resolve_details(
+    glossaries: Sequence[Glossary], term: str, column: Optional[str] = None
+) -> List[Dict[str, object]]:
+    results = []
+    for glossary in glossaries:
+        if not glossary.selected:
+            continue
+        position = glossary.column_position(column)
+        if position is None:
+            continue
+        index = glossary.shared.column_indexes[position]
+        positions = scan_rows(glossary.shared, position, term) if index is None else index.rows_for(term)
+        if not len(positions):
+            continue
+        rows = glossary.table.records(positions)
+        results.append({"glossary": glossary.display_name, "rows": rows})
+    return results
+
+
+def details_bytes(results: List[Dict[str, object]]) -> int:
+    """Approximate size of resolved details; row values are decoded copies, so unlike matches they count."""
+    total = sys.getsizeof(results)
+    for result in results:
+        rows = cast(List[Dict[str, Optional[str]]], result["rows"])
+        total += sys.getsizeof(result) + sys.getsizeof(rows)
+        total += sum(sys.getsizeof(row) + sum(map(sys.getsizeof, row.values())) for row in rows)
+    return total
+
+
+def stream_batch_details(
+    session: SessionState, terms: Iterable[str], column: Optional[str] = None
+) -> StreamingResponse:
+    """Resolve many terms against one snapshot, streaming one JSON object per term."""
+    unique = list(dict.fromkeys(term.strip() for term in terms if term.strip()))
+    if len(unique) > MAX_BATCH_TERMS:
+        raise HTTPException(status_code=413, detail=f"A batch may contain at most {MAX_BATCH_TERMS} terms.")
+    glossaries = session.snapshot.glossaries
+
+    def generate() -> Iterator[str]:
+        yield f'{{"total": {len(unique)}, "results": ['
+        for start in range(0, len(unique), EXPORT_CHUNK_SIZE):
+            chunk = ", ".join(
+                json.dumps({"term": term, "results": resolve_details(glossaries, term, column)})
+                for term in unique[start : start + EXPORT_CHUNK_SIZE]
+            )
+            yield chunk if start == 0 else ", " + chunk
+        yield "]}"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def get_term_matcher(snapshot: SessionSnapshot) -> TermMatcher:
+    matcher = MATCHER_CACHE.get(snapshot.selected_keys)
+    if matcher is None:
+        indexes = {glossary.shared.key: glossary.term_index for glossary in snapshot.glossaries}
+        with timed("extract_build"):
+            matcher = TermMatcher([(key, indexes[key]) for key in snapshot.selected_keys])
+        MATCHER_CACHE.put(snapshot.selected_keys, matcher)
+    return matcher
+
+
+def extract_terms(snapshot: SessionSnapshot, text: str) -> Dict[str, object]:
+    matcher = get_term_matcher(snapshot)
+    names: Dict[str, List[str]] = {}
+    for key, display_name in snapshot.selected_sources:
+        names.setdefault(key, []).append(display_name)
+    occurrences = []
+    counts: Dict[int, int] = {}
+    with timed("extract_scan"):
+        hits = sorted(matcher.scan(text), key=lambda hit: (hit[1], -hit[2]))
+    for pattern, start, end in hits:
+        occurrences.append({"term": matcher.patterns[pattern][0], "start": start, "end": end})
+        counts[pattern] = counts.get(pattern, 0) + 1
+    terms = [
+        {
+            "term": matcher.patterns[pattern][0],
+            "count": count,
+            "glossaries": [name for key in matcher.sources[pattern] for name in names.get(key, [])],
+        }
+        for pattern, count in counts.items()
+    ]
+    return {"terms": terms, "matches": occurrences}
+
+
+def stream_term_list(matches: List[Tuple[str, str]]) -> Iterator[str]:
+    yield f'{{"total": {len(matches)}, "terms": ['
+    for start in range(0, len(matches), EXPORT_CHUNK_SIZE):
+        chunk = ", ".join(json.dumps(term) for _, term in matches[start : start + EXPORT_CHUNK_SIZE])
+        yield chunk if start == 0 else ", " + chunk
+    yield "]}"
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+async def spool_upload(upload: UploadFile, limit: int, limit_message: str) -> Tuple[str, int, str]:
+    suffix = Path(upload.filename or "").suffix.lower()
+    handle = tempfile.NamedTemporaryFile(prefix="glossary-", suffix=suffix, dir=UPLOAD_SPOOL_DIR, delete=False)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with handle:
+            while True:
+                chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > limit:
+                    raise UploadTooLarge(limit_message)
+                digest.update(chunk)
+                handle.write(chunk)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+    return handle.name, size, digest.hexdigest()
+
+
+def remove_spooled(path: str) -> None:
+    with suppress(OSError):
+        os.unlink(path)
+
+
+def entity_tag(*parts: object) -> str:
+    """Weak tag: the same content is sent gzipped or not, so its bytes are not identical across encodings."""
+    return 'W/"' + hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Tag the response for revalidation; return a 304 when the client already holds ``etag``.
+
+    ``If-None-Match`` uses the weak comparison, so strong and weak forms of a tag both match.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    candidates = {_opaque_tag(tag) for tag in request.headers.get("if-none-match", "").split(",")}
+    if _opaque_tag(etag) not in candidates and "*" not in candidates:
+        return None
+    unchanged = Response(status_code=304)
+    unchanged.headers.raw.extend(response.headers.raw)
+    return unchanged
+
+
+def json_response(response: Response, content: object) -> Response:
+    """Encode ``content`` in one timed pass instead of running FastAPI's encoder over it first.
+
+    ``content`` must already be plain JSON types; headers set on ``response`` carry over.
+    """
+    rendered = TimedJSONResponse(content)
+    rendered.headers.raw.extend(response.headers.raw)
+    return rendered
+
+
+def find_glossary(glossaries: Sequence[Glossary], glossary_id: str) -> Glossary:
+    for glossary in glossaries:
         if glossary.id == glossary_id:
             return glossary
     raise HTTPException(status_code=404, detail="Glossary not found")
@@ -145,56 +759,149 @@ def serve_index() -> FileResponse:
     return FileResponse(index_path)
 
 
-@app.get("/api/glossaries")
-def list_glossaries(session: SessionState = Depends(get_session_state)) -> Dict[str, List[Dict[str, object]]]:
-    return {"glossaries": [summarize_glossary(g) for g in session.glossaries]}
+@app.get("/api/glossaries", response_model=None)
+def list_glossaries(
+    request: Request,
+    response: Response,
+    session: SessionState = Depends(get_session_state),
+) -> Union[Dict[str, List[Dict[str, object]]], Response]:
+    summaries = [summarize_glossary(g) for g in session.glossaries]
+    etag = entity_tag("glossaries", summaries)
+    unchanged = not_modified(request, response, etag)
+    if unchanged is not None:
+        return unchanged
+    return json_response(response, {"glossaries": summaries})
 
 
 @app.post("/api/glossaries/upload")
 async def upload_glossaries(
     files: List[UploadFile] = File(...),
+    columns: Optional[str] = Form(None),
     session: SessionState = Depends(get_session_state),
 ) -> Dict[str, List[Dict[str, object]]]:
     if not files:
         raise HTTPException(status_code=400, detail="Please provide one or more glossary files.")
 
-    new_glossaries = []
+    wanted_columns = columns.split(",") if columns else None
+    loop = asyncio.get_running_loop()
+    executor = get_parse_executor()
+
+    session_bytes = sum(glossary.size_bytes for glossary in session.glossaries)
+    reports: List[Dict[str, object]] = []
+    ready: List[Tuple[Dict[str, object], SharedGlossary]] = []
+    pending = []
+    owned = []
+    stored = set()
+    saving = []
+
+    async def load_or_parse(key: str, filename: str, path: str) -> ParsedGlossary:
+        """Reopen the stored copy, or parse the spooled upload when that copy cannot be used."""
+        parsed = await loop.run_in_executor(None, load_stored_glossary, key)
+        if parsed is not None:
+            stored.add(key)
+            return parsed
+        return await loop.run_in_executor(executor, parse_glossary, filename, path, wanted_columns)
+
     for upload in files:
-        suffix = Path(upload.filename).suffix.lower()
-        content = await upload.read()
-        if not content:
+        filename = upload.filename or ""
+        report: Dict[str, object] = {"filename": filename, "status": "skipped", "detail": None}
+        reports.append(report)
+        if not is_supported(filename):
+            report["detail"] = "Only CSV and Excel files are supported."
             continue
+        session_room = MAX_SESSION_UPLOAD_BYTES - session_bytes
+        if session_room < MAX_UPLOAD_BYTES:
+            limit, limit_message = session_room, "The session upload limit has been reached."
+        else:
+            limit, limit_message = MAX_UPLOAD_BYTES, "The file exceeds the maximum upload size."
         try:
-            if suffix == ".csv":
-                delimiter = detect_csv_delimiter(content)
-                encoding = chardet.detect(content).get("encoding") or "utf-8"
-                df = pd.read_csv(BytesIO(content), delimiter=delimiter, encoding=encoding, engine="python")
-            elif suffix in {".xlsx", ".xls"}:
-                df = pd.read_excel(BytesIO(content), engine="openpyxl")
-            else:
-                continue
-        except (pd.errors.ParserError, ValueError):
+            with timed("spool_upload"):
+                path, size, digest = await spool_upload(upload, limit, limit_message)
+        except UploadTooLarge as exc:
+            report["status"] = "failed"
+            report["detail"] = str(exc)
             continue
+        if not size:
+            remove_spooled(path)
+            report["detail"] = "The file is empty."
+            continue
+        session_bytes += size
+        report["size_bytes"] = size
+        key = content_key(digest, wanted_columns)
 
-        if df.empty:
+        shared = GLOSSARY_CACHE.acquire(key)
+        if shared is not None:
+            remove_spooled(path)
+            report["cached"] = True
+            ready.append((report, shared))
             continue
+        future = PARSES_IN_FLIGHT.get(key)
+        if future is None:
+            if GLOSSARY_STORE is not None and GLOSSARY_STORE.has_glossary(key):
+                future = asyncio.ensure_future(load_or_parse(key, filename, path))
+            else:
+                future = loop.run_in_executor(executor, parse_glossary, filename, path, wanted_columns)
+            PARSES_IN_FLIGHT[key] = future
+            owned.append((key, path, future))
+        else:
+            remove_spooled(path)
+        pending.append((report, key, future))
+
+    try:
+        outcomes = await asyncio.gather(*(future for _, _, future in pending), return_exceptions=True)
+        for (report, key, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                report["status"] = "failed"
+                report["detail"] = str(outcome) or type(outcome).__name__
+                continue
+            for stage, seconds in outcome.timings.items():
+                record_stage(stage, seconds)
+            shared = GLOSSARY_CACHE.add(key, outcome.table, outcome.column_indexes, int(report["size_bytes"]))
+            ready.append((report, shared))
+            if key not in stored:
+                stored.add(key)
+                saving.append(loop.run_in_executor(None, persist_glossary, shared))
+    finally:
+        for key, path, future in owned:
+            remove_spooled(path)
+            if PARSES_IN_FLIGHT.get(key) is future:
+                del PARSES_IN_FLIGHT[key]
 
+    order = {id(report): position for position, report in enumerate(reports)}
+    new_glossaries = []
+    for report, shared in sorted(ready, key=lambda item: order[id(item[0])]):
+        filename = str(report["filename"])
         glossary = Glossary(
             id=str(uuid.uuid4()),
-            filename=upload.filename,
-            display_name=os.path.basename(upload.filename),
-            dataframe=df,
-            term_column=str(df.columns[0]),
-            selected=True,
-            preload_terms=len(df) <= LARGE_GLOSSARY_LIMIT,
+            filename=filename,
+            display_name=os.path.basename(filename),
+            shared=shared,
         )
-        session.glossaries.append(glossary)
         new_glossaries.append(glossary)
+        report["status"] = "loaded"
+        report["id"] = glossary.id
+
+    if new_glossaries:
+        await asyncio.gather(*saving)
+        for _, shared in ready:
+            ensure_indexed(shared)
+        try:
+            session = await run_in_threadpool(
+                persist_session, session, lambda glossaries: glossaries + tuple(new_glossaries)
+            )
+        except HTTPException:
+            for glossary in new_glossaries:
+                GLOSSARY_CACHE.release(glossary.shared)
+            raise
+    await run_in_threadpool(sweep_sessions, keep=session.id, force=True)
 
     if not new_glossaries:
-        raise HTTPException(status_code=400, detail="No glossaries could be parsed.")
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "No glossaries could be parsed.", "files": reports},
+        )
 
-    return {"glossaries": [summarize_glossary(g) for g in session.glossaries]}
+    return {"glossaries": [summarize_glossary(g) for g in session.glossaries], "files": reports}
 
 
 @app.post("/api/glossaries/{glossary_id}/selection")
@@ -203,44 +910,225 @@ def update_selection(
     payload: Dict[str, bool],
     session: SessionState = Depends(get_session_state),
 ) -> Dict[str, object]:
-    glossary = find_glossary(session, glossary_id)
-    glossary.selected = bool(payload.get("selected", False))
-    return {"id": glossary.id, "selected": glossary.selected}
+    selected = bool(payload.get("selected", False))
+
+    def select(glossaries: Tuple[Glossary, ...]) -> Iterable[Glossary]:
+        glossary = find_glossary(glossaries, glossary_id)
+        updated = replace(glossary, selected=selected)
+        return (updated if item is glossary else item for item in glossaries)
 
+    persist_session(session, select)
+    return {"id": glossary_id, "selected": selected}
 
-@app.get("/api/terms")
+
+@app.delete("/api/glossaries/{glossary_id}")
+def remove_glossary(
+    glossary_id: str,
+    session: SessionState = Depends(get_session_state),
+) -> Dict[str, List[Dict[str, object]]]:
+    removed: List[Glossary] = []
+
+    def remove(glossaries: Tuple[Glossary, ...]) -> Iterable[Glossary]:
+        removed[:] = [find_glossary(glossaries, glossary_id)]
+        return (item for item in glossaries if item is not removed[0])
+
+    session = persist_session(session, remove)
+    GLOSSARY_CACHE.release(removed[0].shared)
+    return {"glossaries": [summarize_glossary(g) for g in session.glossaries]}
+
+
+@app.get("/api/terms", response_model=None)
 def search_terms(
+    request: Request,
+    response: Response,
+    search: str = "",
+    exact: bool = False,
+    whole_word: bool = False,
+    prefix: bool = False,
+    ranked: bool = False,
+    fuzzy: bool = False,
+    max_edits: Optional[int] = Query(None, ge=0, le=MAX_EDITS),
+    column: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    session: SessionState = Depends(get_session_state),
+) -> Union[Dict[str, object], Response]:
+    snapshot = session.snapshot
+    needle = normalize_key(search)
+    mode = query_mode(exact, whole_word, prefix, fuzzy, max_edits)
+    etag = entity_tag("terms", snapshot.selected_keys, column, needle, mode, ranked, limit, offset)
+    unchanged = not_modified(request, response, etag)
+    if unchanged is not None:
+        return unchanged
+    matches = find_term_matches(session, search, mode, snapshot=snapshot, column=column)
+    if ranked and needle and fuzzy_edits(mode, needle) is None:
+        with timed("rank"):
+            selected = top_ranked(matches, needle, offset + limit)[offset:]
+    else:
+        selected = matches[offset : offset + limit]
+    page = [term for _, term in selected]
+    end = offset + len(page)
+    return json_response(
+        response,
+        {
+            "terms": page,
+            "total": len(matches),
+            "offset": offset,
+            "next_offset": end if end < len(matches) else None,
+        },
+    )
+
+
+@app.get("/api/terms/export")
+def export_terms(
+    request: Request,
+    response: Response,
     search: str = "",
     exact: bool = False,
     whole_word: bool = False,
+    prefix: bool = False,
+    fuzzy: bool = False,
+    max_edits: Optional[int] = Query(None, ge=0, le=MAX_EDITS),
+    column: Optional[str] = None,
     session: SessionState = Depends(get_session_state),
-) -> Dict[str, List[str]]:
-    terms = build_term_list(session, search, exact, whole_word)
-    return {"terms": terms}
+) -> Response:
+    snapshot = session.snapshot
+    mode = query_mode(exact, whole_word, prefix, fuzzy, max_edits)
+    etag = entity_tag("export", snapshot.selected_keys, column, normalize_key(search), mode)
+    unchanged = not_modified(request, response, etag)
+    if unchanged is not None:
+        return unchanged
+    matches = find_term_matches(session, search, mode, snapshot=snapshot, column=column)
+    streamed = StreamingResponse(stream_term_list(matches), media_type="application/json")
+    streamed.headers.raw.extend(response.headers.raw)
+    return streamed
 
 
-@app.get("/api/terms/details/{term}")
+@app.get("/api/terms/details/{term}", response_model=None)
 def term_details(
     term: str,
+    request: Request,
+    response: Response,
+    column: Optional[str] = None,
     session: SessionState = Depends(get_session_state),
-) -> Dict[str, object]:
-    term_lower = term.lower()
-    results = []
-    for glossary in session.glossaries:
-        if not glossary.selected:
-            continue
-        series = glossary.dataframe[glossary.term_column]
-        mask = series.astype(str, errors="ignore").str.lower() == term_lower
-        matches = glossary.dataframe.loc[mask]
-        if matches.empty:
-            continue
-        rows = []
-        for _, row in matches.iterrows():
-            row_data = {
-                column: normalize_text(row[column])
-                for column in glossary.dataframe.columns
-            }
-            rows.append(row_data)
-        results.append({"glossary": glossary.display_name, "rows": rows})
-    return {"term": term, "results": results}
+) -> Union[Dict[str, object], Response]:
+    snapshot = session.snapshot
+    cache_key = (snapshot.selected_sources, column or None, term)
+    unchanged = not_modified(request, response, entity_tag("details", *cache_key))
+    if unchanged is not None:
+        return unchanged
+    results = DETAILS_CACHE.get(cache_key)
+    if results is None:
+        with timed("details"):
+            results = resolve_details(snapshot.glossaries, term, column)
+        DETAILS_CACHE.put(cache_key, results)
+    return json_response(response, {"term": term, "results": results})
+
+
+@app.post("/api/terms/details")
+def batch_term_details(
+    terms: List[str] = Body(..., embed=True),
+    column: Optional[str] = Body(None),
+    session: SessionState = Depends(get_session_state),
+) -> StreamingResponse:
+    return stream_batch_details(session, terms, column)
+
+
+@app.post("/api/terms/details/upload")
+async def batch_term_details_upload(
+    file: UploadFile = File(...),
+    column: Optional[str] = Form(None),
+    session: SessionState = Depends(get_session_state),
+) -> StreamingResponse:
+    data = await file.read(MAX_BATCH_FILE_BYTES + 1)
+    if len(data) > MAX_BATCH_FILE_BYTES:
+        raise HTTPException(status_code=413, detail="The term list file is too large.")
+    text = data.decode(detect_encoding(data[:ENCODING_SAMPLE_SIZE]), errors="replace")
+    return stream_batch_details(session, text.splitlines(), column)
+
+
+@app.post("/api/extract", response_model=None)
+def extract_from_text(
+    response: Response,
+    text: str = Body(..., embed=True),
+    session: SessionState = Depends(get_session_state),
+) -> Response:
+    if len(text) > MAX_DOCUMENT_BYTES:
+        raise HTTPException(status_code=413, detail="The document is too large.")
+    return json_response(response, extract_terms(session.snapshot, text))
+
 
+@app.post("/api/extract/upload", response_model=None)
+async def extract_from_document(
+    response: Response,
+    file: UploadFile = File(...),
+    session: SessionState = Depends(get_session_state),
+) -> Response:
+    filename = file.filename or ""
+    if Path(filename).suffix.lower() not in DOCUMENT_SUFFIXES:
+        raise HTTPException(status_code=400, detail="Only .txt and .docx documents are supported.")
+    data = await file.read(MAX_DOCUMENT_BYTES + 1)
+    if len(data) > MAX_DOCUMENT_BYTES:
+        raise HTTPException(status_code=413, detail="The document is too large.")
+    try:
+        text = read_document(filename, data, detect_encoding(data[:ENCODING_SAMPLE_SIZE]))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    result = await run_in_threadpool(extract_terms, session.snapshot, text)
+    return json_response(response, {"text": text, **result})
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> str:
+    sessions = list(SESSION_STORE.values())
+    session_memory = [
+        sum(glossary.shared.memory_bytes for glossary in session.glossaries) for session in sessions
+    ]
+    lines = REQUEST_SECONDS.render() + STAGE_SECONDS.render()
+    lines += render_gauges("glossary_sessions", "Sessions held in this process.", [((), len(sessions))])
+    lines += render_gauges(
+        "glossary_session_memory_bytes",
+        "Approximate memory of the glossaries sessions reference; shared glossaries count once per session.",
+        [
+            ((("quantity", "total"),), sum(session_memory)),
+            ((("quantity", "max"),), max(session_memory, default=0)),
+        ],
+    )
+
+    shared = GLOSSARY_CACHE.entries()
+    per_glossary = {
+        "glossary_rows": ("Rows per cached glossary.", lambda entry: entry.table.row_count),
+        "glossary_terms": ("Distinct terms per cached glossary.", lambda entry: len(entry.term_index)),
+        "glossary_memory_bytes": ("Approximate memory per cached glossary.", lambda entry: entry.memory_bytes),
+        "glossary_references": ("Sessions referencing each cached glossary.", lambda entry: entry.references),
+        "glossary_index_progress": ("Share of columns indexed.", lambda entry: entry.index_progress),
+    }
+    for name, (help_text, measure) in per_glossary.items():
+        lines += render_gauges(name, help_text, [((("key", entry.key[:16]),), measure(entry)) for entry in shared])
+
+    caches = {"match": MATCH_CACHE.stats(), "details": DETAILS_CACHE.stats(), "matcher": MATCHER_CACHE.stats()}
+    for stat, name, help_text, kind in (
+        ("hits", "glossary_result_cache_hits_total", "Result cache hits.", "counter"),
+        ("misses", "glossary_result_cache_misses_total", "Result cache misses.", "counter"),
+        ("entries", "glossary_result_cache_entries", "Entries held by each result cache.", "gauge"),
+    ):
+        values = [((("cache", cache),), stats[stat]) for cache, stats in caches.items()]
+        lines += render_gauges(name, help_text, values, kind)
+    lines += render_gauges(
+        "glossary_evictions_total",
+        "Sessions and glossaries dropped by the sweeper.",
+        [((("kind", kind),), count) for kind, count in EVICTION_STATS.items()],
+        kind="counter",
+    )
+    return "\n".join(lines) + "\n"
+
+
+@app.get("/api/stats")
+def cache_stats() -> Dict[str, object]:
+    return {
+        "match_cache": MATCH_CACHE.stats(),
+        "details_cache": DETAILS_CACHE.stats(),
+        "matcher_cache": MATCHER_CACHE.stats(),
+        "glossary_cache": {"entries": len(GLOSSARY_CACHE), "memory_bytes": GLOSSARY_CACHE.memory_bytes},
+        "evictions": dict(EVICTION_STATS),
+    }
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+PROFILE_HEADER = "X-Glossary-Profile"
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = Lock()
+
+    def observe(self, seconds: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 3)
+            series[bisect.bisect_left(self.buckets, seconds)] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {key: list(series) for key, series in self._series.items()}
+        for key, series in sorted(snapshot.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{format_labels(key + (('le', repr(bound)),))} {cumulative:g}")
+            lines.append(f"{self.name}_bucket{format_labels(key + (('le', '+Inf'),))} {series[-1]:g}")
+            lines.append(f"{self.name}_sum{format_labels(key)} {series[-2]:.6f}")
+            lines.append(f"{self.name}_count{format_labels(key)} {series[-1]:g}")
+        return lines
+
+
+def render_gauges(
+    name: str, help_text: str, values: Sequence[Tuple[Labels, float]], kind: str = "gauge"
+) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{format_labels(labels)} {value:g}" for labels, value in values)
+    return lines
+
+
+REQUEST_SECONDS = Histogram("glossary_request_duration_seconds", "Time until the response headers are sent.")
+STAGE_SECONDS = Histogram("glossary_stage_duration_seconds", "Time spent in instrumented processing stages.")
+
+_profile: ContextVar[Optional[Dict[str, float]]] = ContextVar("glossary_profile", default=None)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    profile = _profile.get()
+    if profile is not None:
+        profile[stage] = profile.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started)
+
+
+def start_profile() -> Dict[str, float]:
+    profile: Dict[str, float] = {}
+    _profile.set(profile)
+    return profile
+
+
+class MetricsMiddleware:
+    """Time every HTTP request; with the profiling header, also answer with a ``Server-Timing`` breakdown.
+
+    Durations cover the time until the response headers are sent, so for
+    streamed responses the body is not included.
+    """
+
+    def __init__(self, app, header: str = PROFILE_HEADER) -> None:
+        self.app = app
+        self.header = header.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        wanted = any(name == self.header and value not in (b"", b"0") for name, value in scope["headers"])
+        profile = start_profile() if wanted else None
+
+        async def send_with_timing(message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - started
+                route = scope.get("route")
+                REQUEST_SECONDS.observe(
+                    elapsed,
+                    method=scope["method"],
+                    route=getattr(route, "path", "unmatched"),
+                    status=str(message["status"]),
+                )
+                if profile is not None:
+                    message = dict(message)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", server_timing(profile, elapsed).encode("latin-1"))
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+
+def server_timing(profile: Dict[str, float], total: float) -> str:
+    other = max(total - sum(profile.values()), 0.0)
+    parts = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in profile.items()]
+    parts.append(f"other;dur={other * 1000:.3f}")
+    parts.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(parts)
+
+
+class StageTimings(Dict[str, float]):
+    """Stage durations collected where the metrics registry is out of reach, such as a parse worker process."""
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self[stage] = self.get(stage, 0.0) + time.perf_counter() - started
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import re
+import unicodedata
+from typing import Callable, Dict, Sequence
+
+import pandas as pd
+
+KEY_NORMALIZATION = os.environ.get("GLOSSARY_KEY_NORMALIZATION", "nfkc,casefold,collapse_whitespace")
+WHITESPACE = re.compile(r"\s+")
+
+
+def fold_diacritics(text: str) -> str:
+    """Drop combining marks so ``café`` and ``cafe`` share a key; letters like ``ø`` or ``ł`` are kept."""
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFD", text)
+    return unicodedata.normalize("NFC", "".join(char for char in decomposed if not unicodedata.combining(char)))
+
+
+def collapse_whitespace(text: str) -> str:
+    return WHITESPACE.sub(" ", text).strip()
+
+
+STEPS: Dict[str, Callable[[str], str]] = {
+    "nfkc": lambda text: unicodedata.normalize("NFKC", text),
+    "casefold": str.casefold,
+    "fold_diacritics": fold_diacritics,
+    "collapse_whitespace": collapse_whitespace,
+}
+STEP_ORDER = tuple(STEPS)
+
+
+class KeyNormalizer:
+    """Turns display text into the search key every comparison is made on.
+
+    Keys are computed once per term at ingest and once per query, so the
+    same pipeline must be used for both; :attr:`signature` identifies it in
+    content keys and stored glossaries. Steps always run in ``STEP_ORDER``
+    whatever order they are configured in.
+    """
+
+    __slots__ = ("steps", "signature")
+
+    def __init__(self, steps: Sequence[str]) -> None:
+        wanted = {step.strip().lower() for step in steps if step.strip()}
+        unknown = wanted - set(STEPS)
+        if unknown:
+            raise ValueError(f"Unknown key normalization step(s): {', '.join(sorted(unknown))}.")
+        self.steps = tuple(step for step in STEP_ORDER if step in wanted)
+        self.signature = ",".join(self.steps)
+
+    @classmethod
+    def from_config(cls, config: str) -> "KeyNormalizer":
+        return cls(config.split(","))
+
+    def __call__(self, text: str) -> str:
+        text = text.strip()
+        for step in self.steps:
+            text = STEPS[step](text)
+        return text
+
+    def normalize_series(self, values: pd.Series) -> pd.Series:
+        keys = values.str.strip()
+        for step in self.steps:
+            if step == "nfkc":
+                keys = keys.str.normalize("NFKC")
+            elif step == "casefold":
+                keys = keys.str.casefold()
+            else:
+                keys = keys.map(STEPS[step])
+        return keys
+
+    def token(self, text: str) -> str:
+        """Key of a single token; whitespace handling does not apply inside a token."""
+        for step in self.steps:
+            if step != "collapse_whitespace":
+                text = STEPS[step](text)
+        return text
+
+
+KEY_NORMALIZER = KeyNormalizer.from_config(KEY_NORMALIZATION)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ResultCache(Generic[T]):
+    """Thread-safe LRU of query results bounded by a total weight.
+
+    Keys are built from glossary content hashes, so entries never go stale:
+    changing the selection or uploading simply produces a different key, and
+    old entries age out. With the default ``weigh`` every entry weighs 1, so
+    ``max_weight`` is simply the number of entries kept.
+    """
+
+    def __init__(self, max_weight: int, weigh: Callable[[T], int] = lambda _: 1) -> None:
+        self.max_weight = max_weight
+        self.weigh = weigh
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._weights: Dict[Hashable, int] = {}
+        self._weight = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def weight(self) -> int:
+        return self._weight
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        weight = self.weigh(value)
+        if weight > self.max_weight:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._weight -= self._weights[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._weights[key] = weight
+            self._weight += weight
+            while self._weight > self.max_weight:
+                evicted, _ = self._entries.popitem(last=False)
+                self._weight -= self._weights.pop(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._weight = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "weight": self._weight,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
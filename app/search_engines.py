@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+SEPARATOR = "\x00"
+SEARCH_ENGINE = os.environ.get("GLOSSARY_SEARCH_ENGINE", "auto")
+TRIGRAM_ENGINE_MIN_TERMS = int(os.environ.get("GLOSSARY_TRIGRAM_MIN_TERMS", "50000"))
+
+
+class SearchEngine(Protocol):
+    """Answers substring and whole-word queries over normalized term keys.
+
+    Both methods take an already normalized needle and return the matching
+    term positions in ascending order.
+    """
+
+    def substring(self, needle: str) -> List[int]:
+        ...
+
+    def whole_word(self, needle: str) -> List[int]:
+        ...
+
+    @property
+    def nbytes(self) -> int:
+        ...
+
+
+UNSPACED_RANGES = (
+    ("\u0e00", "\u0eff"),  # Thai, Lao
+    ("\u3040", "\u30ff"),  # Hiragana, Katakana
+    ("\u3400", "\u4dbf"),  # CJK extension A
+    ("\u4e00", "\u9fff"),  # CJK unified ideographs
+    ("\uf900", "\ufaff"),  # CJK compatibility ideographs
+    ("\uff66", "\uff9f"),  # halfwidth Katakana
+    ("\U00020000", "\U0003134f"),  # CJK extensions B-G
+)
+
+
+def is_unspaced(char: str) -> bool:
+    """Whether ``char`` belongs to a script written without spaces between words."""
+    return char >= "\u0e00" and any(low <= char <= high for low, high in UNSPACED_RANGES)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _continues_word(left: str, right: str) -> bool:
+    if not (_is_word_char(left) and _is_word_char(right)):
+        return False
+    return not (is_unspaced(left) or is_unspaced(right))
+
+
+def is_whole_word(text: str, start: int, end: int) -> bool:
+    """Whether ``text[start:end]`` does not run into a word on either side.
+
+    Unlike regex ``\\b``, an edge that is punctuation (``C++``, ``.NET``)
+    needs no word character next to it, and every character of a script
+    written without spaces (Chinese, Japanese, Thai) counts as a word of
+    its own.
+    """
+    if start > 0 and _continues_word(text[start - 1], text[start]):
+        return False
+    return end >= len(text) or not _continues_word(text[end - 1], text[end])
+
+
+def contains_whole_word(text: str, needle: str) -> bool:
+    position = text.find(needle)
+    while position != -1:
+        if is_whole_word(text, position, position + len(needle)):
+            return True
+        position = text.find(needle, position + 1)
+    return False
+
+
+class ScanEngine:
+    """Linear scan over all keys joined into one string."""
+
+    __slots__ = ("blob", "offsets")
+
+    def __init__(self, keys: Sequence[str], blob: Optional[str] = None) -> None:
+        self.blob = SEPARATOR.join(keys) if blob is None else blob
+        offsets = array("q")
+        position = 0
+        for key in keys:
+            offsets.append(position)
+            position += len(key) + 1
+        offsets.append(position)
+        self.offsets = offsets
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.blob) + self.offsets.itemsize * len(self.offsets)
+
+    def _owner(self, position: int) -> int:
+        return bisect_right(self.offsets, position) - 1
+
+    def substring(self, needle: str) -> List[int]:
+        find = self.blob.find
+        offsets = self.offsets
+        hits = []
+        position = find(needle)
+        while position != -1:
+            owner = self._owner(position)
+            hits.append(owner)
+            position = find(needle, offsets[owner + 1])
+        return hits
+
+    def whole_word(self, needle: str) -> List[int]:
+        blob = self.blob
+        find = blob.find
+        offsets = self.offsets
+        hits = []
+        position = find(needle)
+        while position != -1:
+            if is_whole_word(blob, position, position + len(needle)):
+                owner = self._owner(position)
+                hits.append(owner)
+                position = find(needle, offsets[owner + 1])
+            else:
+                position = find(needle, position + 1)
+        return hits
+
+
+class TrigramEngine:
+    """Trigram inverted index; query cost follows the rarest trigram's posting list.
+
+    Needles shorter than three characters have no trigram to filter on and
+    fall back to the embedded :class:`ScanEngine`.
+    """
+
+    __slots__ = ("keys", "postings", "scan")
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        blob: Optional[str] = None,
+        postings: Optional[Dict[str, np.ndarray]] = None,
+    ) -> None:
+        self.keys = keys
+        self.scan = ScanEngine(keys, blob)
+        self.postings = trigram_postings(keys) if postings is None else postings
+
+    @property
+    def nbytes(self) -> int:
+        postings = sum(posting.nbytes for posting in self.postings.values())
+        return self.scan.nbytes + postings + sys.getsizeof(self.postings)
+
+    def _candidates(self, needle: str) -> np.ndarray:
+        grams = {needle[start : start + 3] for start in range(len(needle) - 2)}
+        lists = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(posting)
+        lists.sort(key=len)
+        candidates = lists[0]
+        for posting in lists[1:]:
+            if len(candidates) <= 32:
+                break
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        return candidates
+
+    def substring(self, needle: str) -> List[int]:
+        if len(needle) < 3:
+            return self.scan.substring(needle)
+        keys = self.keys
+        return [index for index in self._candidates(needle).tolist() if needle in keys[index]]
+
+    def whole_word(self, needle: str) -> List[int]:
+        if len(needle) < 3:
+            return self.scan.whole_word(needle)
+        keys = self.keys
+        return [
+            index for index in self._candidates(needle).tolist() if contains_whole_word(keys[index], needle)
+        ]
+
+
+def trigram_postings(keys: Sequence[str]) -> Dict[str, np.ndarray]:
+    builders: Dict[str, array] = {}
+    for index, key in enumerate(keys):
+        for gram in {key[start : start + 3] for start in range(len(key) - 2)}:
+            posting = builders.get(gram)
+            if posting is None:
+                posting = builders[gram] = array("i")
+            posting.append(index)
+    return {gram: np.frombuffer(posting, dtype=np.int32) for gram, posting in builders.items()}
+
+
+ENGINES = {"scan": ScanEngine, "trigram": TrigramEngine}
+
+
+def engine_kind(count: int, kind: str = SEARCH_ENGINE) -> str:
+    if kind == "auto":
+        return "trigram" if count >= TRIGRAM_ENGINE_MIN_TERMS else "scan"
+    return kind
+
+
+def build_engine(keys: Sequence[str], kind: str = SEARCH_ENGINE) -> SearchEngine:
+    return ENGINES[engine_kind(len(keys), kind)](keys)
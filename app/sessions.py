@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Protocol, Set, Tuple, Union
+
+SESSION_ID_PATTERN = re.compile(r"[0-9a-f-]{36}")
+
+SessionRecord = Tuple[int, Dict[str, object]]
+
+
+def _manifest_keys(manifest: Dict[str, object]) -> Set[str]:
+    return {entry["key"] for entry in manifest.get("glossaries", [])}
+
+
+class SessionBackend(Protocol):
+    """Where session manifests live so any worker process can rebuild a session.
+
+    A manifest lists the session's glossaries by content key; the glossary
+    data itself comes from the shared :class:`~app.store.GlossaryStore`.
+    Every save bumps the session's revision, which workers compare against
+    their in-memory copy to notice changes made elsewhere. Saves are
+    compare-and-set: one made from a revision that is no longer current
+    returns None instead of overwriting the newer manifest.
+    """
+
+    def load(self, session_id: str, max_age: float) -> Optional[SessionRecord]:
+        ...
+
+    def revision(self, session_id: str) -> Optional[int]:
+        ...
+
+    def save(self, session_id: str, manifest: Dict[str, object], expected_revision: int) -> Optional[int]:
+        ...
+
+    def touch(self, session_id: str) -> None:
+        ...
+
+    def expire(self, session_id: str, max_age: float) -> None:
+        ...
+
+    def glossary_keys(self, max_age: float) -> Set[str]:
+        """Content keys referenced by any session saved or touched within ``max_age`` seconds."""
+        ...
+
+
+class MemorySessionBackend:
+    """Manifests kept in this process only; sessions survive memory eviction but not a restart."""
+
+    def __init__(self) -> None:
+        self._records: Dict[str, Tuple[int, float, Dict[str, object]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, session_id: str, max_age: float) -> Optional[SessionRecord]:
+        with self._lock:
+            record = self._records.get(session_id)
+        if record is None or time.time() - record[1] > max_age:
+            return None
+        return record[0], record[2]
+
+    def revision(self, session_id: str) -> Optional[int]:
+        record = self._records.get(session_id)
+        return record[0] if record is not None else None
+
+    def save(self, session_id: str, manifest: Dict[str, object], expected_revision: int) -> Optional[int]:
+        with self._lock:
+            record = self._records.get(session_id)
+            if (record[0] if record is not None else 0) != expected_revision:
+                return None
+            revision = expected_revision + 1
+            self._records[session_id] = (revision, time.time(), manifest)
+        return revision
+
+    def touch(self, session_id: str) -> None:
+        with self._lock:
+            record = self._records.get(session_id)
+            if record is not None:
+                self._records[session_id] = (record[0], time.time(), record[2])
+
+    def expire(self, session_id: str, max_age: float) -> None:
+        with self._lock:
+            record = self._records.get(session_id)
+            if record is not None and time.time() - record[1] > max_age:
+                del self._records[session_id]
+
+    def glossary_keys(self, max_age: float) -> Set[str]:
+        cutoff = time.time() - max_age
+        with self._lock:
+            manifests = [manifest for _, updated_at, manifest in self._records.values() if updated_at >= cutoff]
+        return set().union(*map(_manifest_keys, manifests))
+
+
+class SQLiteSessionBackend:
+    """Manifests in a SQLite database (WAL mode) shared by every worker on the host."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = str(path)
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "id TEXT PRIMARY KEY, revision INTEGER NOT NULL, updated_at REAL NOT NULL, manifest TEXT NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def load(self, session_id: str, max_age: float) -> Optional[SessionRecord]:
+        if not SESSION_ID_PATTERN.fullmatch(session_id):
+            return None
+        row = self._connection().execute(
+            "SELECT revision, manifest FROM sessions WHERE id = ? AND updated_at >= ?",
+            (session_id, time.time() - max_age),
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def revision(self, session_id: str) -> Optional[int]:
+        row = self._connection().execute("SELECT revision FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def save(self, session_id: str, manifest: Dict[str, object], expected_revision: int) -> Optional[int]:
+        if not expected_revision:
+            row = self._connection().execute(
+                "INSERT INTO sessions (id, revision, updated_at, manifest) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT (id) DO NOTHING RETURNING revision",
+                (session_id, time.time(), json.dumps(manifest)),
+            ).fetchone()
+        else:
+            row = self._connection().execute(
+                "UPDATE sessions SET revision = revision + 1, updated_at = ?, manifest = ? "
+                "WHERE id = ? AND revision = ? RETURNING revision",
+                (time.time(), json.dumps(manifest), session_id, expected_revision),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def touch(self, session_id: str) -> None:
+        self._connection().execute("UPDATE sessions SET updated_at = ? WHERE id = ?", (time.time(), session_id))
+
+    def expire(self, session_id: str, max_age: float) -> None:
+        self._connection().execute(
+            "DELETE FROM sessions WHERE id = ? AND updated_at < ?", (session_id, time.time() - max_age)
+        )
+
+    def glossary_keys(self, max_age: float) -> Set[str]:
+        rows = self._connection().execute(
+            "SELECT manifest FROM sessions WHERE updated_at >= ?", (time.time() - max_age,)
+        )
+        return set().union(*(_manifest_keys(json.loads(row[0])) for row in rows))
+
+
+def build_session_backend(kind: str, store_dir: Optional[str]) -> SessionBackend:
+    if kind == "auto":
+        kind = "sqlite" if store_dir else "memory"
+    if kind == "sqlite":
+        if not store_dir:
+            raise ValueError("The SQLite session backend needs GLOSSARY_STORE_DIR.")
+        Path(store_dir).mkdir(parents=True, exist_ok=True)
+        return SQLiteSessionBackend(Path(store_dir) / "sessions.sqlite3")
+    if kind == "memory":
+        return MemorySessionBackend()
+    raise ValueError(f"Unknown session backend '{kind}'.")
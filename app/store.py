@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .normalization import KEY_NORMALIZER
+from .search_engines import SEPARATOR, ScanEngine, SearchEngine, TrigramEngine
+from .table import Column, DictionaryColumn, GlossaryTable, StringColumn
+from .term_index import TermIndex
+
+STORE_FORMAT_VERSION = 2
+
+
+def _join(strings: List[str]) -> bytes:
+    return SEPARATOR.join(strings).encode("utf-8")
+
+
+def _split(data: bytes, count: int) -> List[str]:
+    if not count:
+        return []
+    return data.decode("utf-8").split(SEPARATOR)
+
+
+def _engine_name(term_index: TermIndex) -> str:
+    return "trigram" if isinstance(term_index.engine, TrigramEngine) else "scan"
+
+
+def _map_file(path: Path) -> Union[bytes, mmap.mmap]:
+    with open(path, "rb") as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return b""
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class GlossaryStore:
+    """On-disk copies of parsed glossaries keyed by content hash.
+
+    Column buffers and index arrays are written as raw files and ``.npy``
+    arrays so they can be reopened with ``mmap`` instead of re-parsed; pages
+    are shared between every process that maps the same store.
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        self.glossary_root = self.root / "glossaries"
+        self.glossary_root.mkdir(parents=True, exist_ok=True)
+
+    def _glossary_dir(self, key: str) -> Path:
+        return self.glossary_root / key[:2] / key
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        """The entry's metadata, or None when it is missing or was written in another format or normalization."""
+        try:
+            meta = json.loads((self._glossary_dir(key) / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("format") != STORE_FORMAT_VERSION or meta.get("normalization") != KEY_NORMALIZER.signature:
+            return None
+        return meta
+
+    def has_glossary(self, key: str) -> bool:
+        return self._read_meta(key) is not None
+
+    def remove_unreferenced(self, referenced: Collection[str], min_age: float) -> int:
+        """Delete entries whose key is not in ``referenced`` and that were not written or loaded lately.
+
+        ``min_age`` keeps entries a worker has just saved or reopened but not
+        yet listed in a session manifest. Entries are renamed aside before
+        they are deleted, so a concurrent load sees all of an entry or none;
+        processes that still map its files keep reading them.
+        """
+        cutoff = time.time() - min_age
+        removed = 0
+        for shard in self.glossary_root.iterdir():
+            if not shard.is_dir():
+                continue
+            for directory in shard.iterdir():
+                try:
+                    if directory.name in referenced or directory.stat().st_mtime > cutoff:
+                        continue
+                    if directory.name.startswith("."):
+                        shutil.rmtree(directory)
+                        continue
+                    doomed = shard / f".{directory.name}-{uuid.uuid4().hex}"
+                    os.rename(directory, doomed)
+                except OSError:
+                    continue
+                shutil.rmtree(doomed, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def save_glossary(
+        self, key: str, table: GlossaryTable, column_indexes: List[Optional[TermIndex]], size_bytes: int
+    ) -> None:
+        target = self._glossary_dir(key)
+        if self.has_glossary(key):
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=target.parent))
+        try:
+            meta = {
+                "format": STORE_FORMAT_VERSION,
+                "columns": table.columns,
+                "row_count": table.row_count,
+                "size_bytes": size_bytes,
+                "column_kinds": [self._save_column(staging, position, table.column(position))
+                                 for position in range(len(table.columns))],
+                "normalization": KEY_NORMALIZER.signature,
+                "indexes": [
+                    None if index is None else self._save_index(staging, position, index)
+                    for position, index in enumerate(column_indexes)
+                ],
+            }
+            (staging / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+            if target.exists():
+                # An entry from another format or normalization; move it aside so the new one can take its place.
+                outdated = target.parent / f".{key}-{uuid.uuid4().hex}"
+                os.rename(target, outdated)
+                shutil.rmtree(outdated, ignore_errors=True)
+            os.replace(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not self.has_glossary(key):
+                raise
+
+    @staticmethod
+    def _save_column(directory: Path, position: int, column: Column) -> str:
+        prefix = directory / f"column{position}"
+        if isinstance(column, DictionaryColumn):
+            np.save(f"{prefix}.codes.npy", column.codes)
+            Path(f"{prefix}.values.json").write_text(json.dumps(column.values), encoding="utf-8")
+            return "dictionary"
+        Path(f"{prefix}.data").write_bytes(column.data[:])
+        np.save(f"{prefix}.offsets.npy", column.offsets)
+        np.save(f"{prefix}.missing.npy", column.missing)
+        return "string"
+
+    def save_indexes(self, key: str, column_indexes: List[Optional[TermIndex]]) -> None:
+        """Add indexes built after :meth:`save_glossary`, replacing any that were saved with another engine.
+
+        Files are written aside and moved into place, so processes that have
+        the previous files mapped keep reading the old, unchanged inodes.
+        """
+        target = self._glossary_dir(key)
+        meta = self._read_meta(key)
+        if meta is None:
+            return
+        staging = Path(tempfile.mkdtemp(prefix=".indexes-", dir=target))
+        try:
+            for position, index in enumerate(column_indexes):
+                if index is None:
+                    continue
+                saved = meta["indexes"][position]
+                if saved is not None and saved["engine"] == _engine_name(index):
+                    continue
+                meta["indexes"][position] = self._save_index(staging, position, index)
+            (staging / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+            for path in staging.iterdir():
+                if path.name != "meta.json":
+                    os.replace(path, target / path.name)
+            os.replace(staging / "meta.json", target / "meta.json")
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @staticmethod
+    def _save_index(directory: Path, position: int, term_index: TermIndex) -> Dict[str, object]:
+        prefix = directory / f"index{position}"
+        Path(f"{prefix}.terms.bin").write_bytes(_join(term_index.terms))
+        Path(f"{prefix}.keys.bin").write_bytes(_join(term_index.keys))
+        np.save(f"{prefix}.row_order.npy", term_index.row_order)
+        np.save(f"{prefix}.row_bounds.npy", term_index.row_bounds)
+        meta: Dict[str, object] = {"terms_count": len(term_index), "engine": _engine_name(term_index)}
+        engine = term_index.engine
+        if not isinstance(engine, TrigramEngine):
+            return meta
+        grams = list(engine.postings)
+        lengths = np.fromiter((len(engine.postings[gram]) for gram in grams), dtype=np.int64, count=len(grams))
+        bounds = np.zeros(len(grams) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=bounds[1:])
+        postings = (
+            np.concatenate([engine.postings[gram] for gram in grams]) if grams else np.empty(0, dtype=np.int32)
+        )
+        Path(f"{prefix}.grams.bin").write_bytes(_join(grams))
+        np.save(f"{prefix}.postings.npy", postings)
+        np.save(f"{prefix}.posting_bounds.npy", bounds)
+        return meta
+
+    def load_glossary(self, key: str) -> Optional[Tuple[GlossaryTable, List[Optional[TermIndex]], int]]:
+        directory = self._glossary_dir(key)
+        meta = self._read_meta(key)
+        if meta is None:
+            return None
+        try:
+            os.utime(directory)
+        except OSError:
+            pass
+        columns = [
+            self._load_column(directory, position, kind) for position, kind in enumerate(meta["column_kinds"])
+        ]
+        table = GlossaryTable(columns=meta["columns"], data=columns, row_count=meta["row_count"])
+        column_indexes = [
+            None if index is None else self._load_index(directory, position, index)
+            for position, index in enumerate(meta["indexes"])
+        ]
+        return table, column_indexes, meta["size_bytes"]
+
+    @staticmethod
+    def _load_column(directory: Path, position: int, kind: str) -> Column:
+        prefix = directory / f"column{position}"
+        if kind == "dictionary":
+            values = json.loads(Path(f"{prefix}.values.json").read_text(encoding="utf-8"))
+            return DictionaryColumn(np.load(f"{prefix}.codes.npy", mmap_mode="r"), values)
+        return StringColumn(
+            _map_file(Path(f"{prefix}.data")),
+            np.load(f"{prefix}.offsets.npy", mmap_mode="r"),
+            np.load(f"{prefix}.missing.npy", mmap_mode="r"),
+        )
+
+    @staticmethod
+    def _load_index(directory: Path, position: int, meta: Dict[str, object]) -> TermIndex:
+        prefix = directory / f"index{position}"
+        count = int(meta["terms_count"])
+        keys_blob = Path(f"{prefix}.keys.bin").read_bytes().decode("utf-8")
+        keys = keys_blob.split(SEPARATOR) if count else []
+        terms = _split(Path(f"{prefix}.terms.bin").read_bytes(), count)
+        engine: SearchEngine
+        if meta["engine"] == "trigram":
+            grams_blob = Path(f"{prefix}.grams.bin").read_bytes().decode("utf-8")
+            grams = grams_blob.split(SEPARATOR) if grams_blob else []
+            postings = np.load(f"{prefix}.postings.npy", mmap_mode="r")
+            bounds = np.load(f"{prefix}.posting_bounds.npy")
+            engine = TrigramEngine(
+                keys,
+                blob=keys_blob,
+                postings={gram: postings[bounds[i] : bounds[i + 1]] for i, gram in enumerate(grams)},
+            )
+        else:
+            engine = ScanEngine(keys, blob=keys_blob)
+        return TermIndex(
+            terms=terms,
+            keys=keys,
+            row_order=np.load(f"{prefix}.row_order.npy", mmap_mode="r"),
+            row_bounds=np.load(f"{prefix}.row_bounds.npy", mmap_mode="r"),
+            engine=engine,
+        )
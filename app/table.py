@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import sys
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+DICTIONARY_MAX_VALUES = 4096
+MISSING_CODE = -1
+
+
+class StringColumn:
+    """All cells of a column as one UTF-8 buffer plus row offsets into it."""
+
+    __slots__ = ("data", "offsets", "missing")
+
+    def __init__(self, data: bytes, offsets: np.ndarray, missing: np.ndarray) -> None:
+        self.data = data
+        self.offsets = offsets
+        self.missing = missing
+
+    def __len__(self) -> int:
+        return len(self.missing)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        if self.missing[row]:
+            return None
+        return self.data[self.offsets[row] : self.offsets[row + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.nbytes + self.missing.nbytes
+
+
+class DictionaryColumn:
+    """Low-cardinality column stored as int32 codes into a list of distinct values."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: np.ndarray, values: List[str]) -> None:
+        self.codes = codes
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        code = self.codes[row]
+        return None if code == MISSING_CODE else self.values[code]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(sys.getsizeof(value) for value in self.values)
+
+
+Column = Union[StringColumn, DictionaryColumn]
+
+
+class GlossaryTable:
+    """Read-only, compact replacement for a normalized glossary DataFrame."""
+
+    __slots__ = ("columns", "row_count", "_data")
+
+    def __init__(self, columns: List[str], data: List[Column], row_count: int) -> None:
+        self.columns = columns
+        self.row_count = row_count
+        self._data = data
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._data)
+
+    def column(self, position: int) -> Column:
+        return self._data[position]
+
+    def records(self, rows: Sequence[int]) -> List[Dict[str, Optional[str]]]:
+        columns = list(zip(self.columns, self._data))
+        return [{name: data[int(row)] for name, data in columns} for row in rows]
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "GlossaryTable":
+        builder = GlossaryTableBuilder()
+        builder.add(frame)
+        return builder.build()
+
+
+class _ColumnBuilder:
+    def __init__(self) -> None:
+        self.dictionary: Optional[Dict[str, int]] = {}
+        self.codes: List[np.ndarray] = []
+        self.chunks: List[bytes] = []
+        self.lengths: List[np.ndarray] = []
+        self.missing: List[np.ndarray] = []
+
+    def add(self, values: List[Optional[str]]) -> None:
+        if self.dictionary is not None:
+            dictionary = self.dictionary
+            codes = np.fromiter(
+                (
+                    MISSING_CODE if value is None else dictionary.setdefault(value, len(dictionary))
+                    for value in values
+                ),
+                dtype=np.int32,
+                count=len(values),
+            )
+            self.codes.append(codes)
+            if len(dictionary) <= DICTIONARY_MAX_VALUES:
+                return
+            self._spill()
+            return
+        self._add_strings(values)
+
+    def _spill(self) -> None:
+        distinct = list(self.dictionary or {})
+        self.dictionary = None
+        for codes in self.codes:
+            self._add_strings([None if code == MISSING_CODE else distinct[code] for code in codes.tolist()])
+        self.codes = []
+
+    def _add_strings(self, values: List[Optional[str]]) -> None:
+        encoded = [b"" if value is None else value.encode("utf-8") for value in values]
+        self.chunks.append(b"".join(encoded))
+        self.lengths.append(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)))
+        self.missing.append(np.fromiter((value is None for value in values), dtype=bool, count=len(values)))
+
+    def build(self, row_count: int) -> Column:
+        if self.dictionary is not None and len(self.dictionary) * 2 > row_count:
+            self._spill()
+        if self.dictionary is not None:
+            codes = np.concatenate(self.codes) if self.codes else np.empty(0, dtype=np.int32)
+            return DictionaryColumn(codes, list(self.dictionary))
+        lengths = np.concatenate(self.lengths)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return StringColumn(b"".join(self.chunks), offsets, np.concatenate(self.missing))
+
+
+class GlossaryTableBuilder:
+    """Encodes normalized frames chunk by chunk so no full-size DataFrame is kept."""
+
+    def __init__(self) -> None:
+        self.columns: Optional[List[str]] = None
+        self.row_count = 0
+        self._builders: List[_ColumnBuilder] = []
+
+    def add(self, frame: pd.DataFrame) -> None:
+        if self.columns is None:
+            self.columns = [str(column) for column in frame.columns]
+            self._builders = [_ColumnBuilder() for _ in self.columns]
+        for position, builder in enumerate(self._builders):
+            builder.add(frame.iloc[:, position].tolist())
+        self.row_count += len(frame)
+
+    def build(self) -> GlossaryTable:
+        return GlossaryTable(
+            columns=self.columns or [],
+            data=[builder.build(self.row_count) for builder in self._builders],
+            row_count=self.row_count,
+        )
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import heapq
+import sys
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fuzzy import FuzzyIndex, auto_edits, bounded_distance
+from .normalization import KEY_NORMALIZER
+from .search_engines import (
+    SEARCH_ENGINE,
+    ScanEngine,
+    SearchEngine,
+    build_engine,
+    contains_whole_word,
+    engine_kind,
+)
+
+MODE_EXACT = "exact"
+MODE_PREFIX = "prefix"
+MODE_WHOLE_WORD = "whole_word"
+MODE_SUBSTRING = "substring"
+MODE_FUZZY = "fuzzy"
+PREFIX_CEILING = "\U0010ffff"
+
+
+def query_mode(
+    exact: bool, whole_word: bool, prefix: bool, fuzzy: bool = False, max_edits: Optional[int] = None
+) -> str:
+    if exact:
+        return MODE_EXACT
+    if fuzzy:
+        return MODE_FUZZY if max_edits is None else f"{MODE_FUZZY}:{max_edits}"
+    if prefix:
+        return MODE_PREFIX
+    if whole_word:
+        return MODE_WHOLE_WORD
+    return MODE_SUBSTRING
+
+
+def fuzzy_edits(mode: str, needle: str) -> Optional[int]:
+    """Edit budget of a fuzzy ``mode`` (``fuzzy`` scales with the needle, ``fuzzy:N`` is fixed); None otherwise."""
+    if not mode.startswith(MODE_FUZZY):
+        return None
+    _, _, edits = mode.partition(":")
+    return int(edits) if edits else auto_edits(len(needle))
+
+
+def key_matches(key: str, needle: str, mode: str) -> bool:
+    """What :meth:`TermIndex.search` computes, for a single key."""
+    if not needle:
+        return True
+    if mode == MODE_EXACT:
+        return key == needle
+    if mode == MODE_PREFIX:
+        return key.startswith(needle)
+    if mode == MODE_WHOLE_WORD:
+        return contains_whole_word(key, needle)
+    max_edits = fuzzy_edits(mode, needle)
+    if max_edits is not None:
+        return bounded_distance(key, needle, max_edits) <= max_edits
+    return needle in key
+
+
+def by_distance(matches: List[Tuple[str, str]], needle: str, max_edits: int) -> List[Tuple[str, str]]:
+    return sorted(matches, key=lambda match: (bounded_distance(match[0], needle, max_edits), match))
+
+
+def normalize_key(text: str) -> str:
+    return KEY_NORMALIZER(text)
+
+
+def match_rank(key: str, needle: str) -> int:
+    if key == needle:
+        return 0
+    if key.startswith(needle):
+        return 1
+    if contains_whole_word(key, needle):
+        return 2
+    return 3
+
+
+def top_ranked(matches: Iterable[Tuple[str, str]], needle: str, count: int) -> List[Tuple[str, str]]:
+    """Best ``count`` matches: exact, prefix, whole word, substring, then shorter keys first."""
+    return heapq.nsmallest(count, matches, key=lambda match: (match_rank(match[0], needle), len(match[0]), match))
+
+
+class TermIndex:
+    """Search structures for one term column, built once when a glossary is loaded.
+
+    Terms are the distinct stripped display forms of the column, kept in
+    ``(key, display)`` order so every query yields already sorted hits. Keys
+    come from :data:`KEY_NORMALIZER` and are compared against queries
+    normalized the same way.
+    """
+
+    __slots__ = ("terms", "keys", "row_order", "row_bounds", "engine", "_lookup", "_fuzzy")
+
+    def __init__(
+        self,
+        terms: List[str],
+        keys: List[str],
+        row_order: np.ndarray,
+        row_bounds: np.ndarray,
+        engine: Optional[SearchEngine] = None,
+    ) -> None:
+        self.terms = terms
+        self.keys = keys
+        self.row_order = row_order
+        self.row_bounds = row_bounds
+        self.engine = build_engine(keys) if engine is None else engine
+        self._lookup: Optional[Dict[str, Tuple[int, int]]] = None
+        self._fuzzy: Optional[FuzzyIndex] = None
+
+    @property
+    def lookup(self) -> Dict[str, Tuple[int, int]]:
+        lookup = self._lookup
+        if lookup is None:
+            lookup = {}
+            for index, key in enumerate(self.keys):
+                span = lookup.get(key)
+                lookup[key] = (index, index + 1) if span is None else (span[0], index + 1)
+            self._lookup = lookup
+        return lookup
+
+    @property
+    def fuzzy(self) -> FuzzyIndex:
+        """Built on the first fuzzy query, since most indexes never see one."""
+        fuzzy = self._fuzzy
+        if fuzzy is None:
+            fuzzy = self._fuzzy = FuzzyIndex(self.keys)
+        return fuzzy
+
+    @property
+    def has_fuzzy(self) -> bool:
+        return self._fuzzy is not None
+
+    def needs_engine_upgrade(self) -> bool:
+        """Whether this index was built with the scan engine to be ready sooner than the configured one."""
+        return isinstance(self.engine, ScanEngine) and engine_kind(len(self.keys)) != "scan"
+
+    def with_engine(self, engine: SearchEngine) -> "TermIndex":
+        index = TermIndex(self.terms, self.keys, self.row_order, self.row_bounds, engine=engine)
+        index._lookup = self._lookup
+        index._fuzzy = self._fuzzy
+        return index
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "TermIndex":
+        builder = TermIndexBuilder()
+        builder.add(series, 0)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size; walks every term, so callers should cache it."""
+        strings = sum(map(sys.getsizeof, self.terms)) + sum(map(sys.getsizeof, self.keys))
+        lists = sys.getsizeof(self.terms) + sys.getsizeof(self.keys)
+        lookup = sys.getsizeof(self.lookup) + 64 * len(self.lookup)
+        arrays = self.row_order.nbytes + self.row_bounds.nbytes
+        fuzzy = self._fuzzy.nbytes if self._fuzzy is not None else 0
+        return strings + lists + lookup + arrays + self.engine.nbytes + fuzzy
+
+    def rows_for(self, term: str) -> np.ndarray:
+        span = self.lookup.get(normalize_key(term))
+        if span is None:
+            return self.row_order[:0]
+        return np.sort(self.row_order[self.row_bounds[span[0]] : self.row_bounds[span[1]]])
+
+    def search(self, needle: str, mode: str) -> List[int]:
+        if not needle:
+            return list(range(len(self.terms)))
+        if mode == MODE_EXACT:
+            span = self.lookup.get(needle)
+            return list(range(*span)) if span is not None else []
+        if mode == MODE_PREFIX:
+            keys = self.keys
+            return list(range(bisect_left(keys, needle), bisect_left(keys, needle + PREFIX_CEILING)))
+        if mode == MODE_WHOLE_WORD:
+            return self.engine.whole_word(needle)
+        max_edits = fuzzy_edits(mode, needle)
+        if max_edits is not None:
+            return self.fuzzy.search(needle, max_edits)
+        return self.engine.substring(needle)
+
+    def iter_sorted(self, indices: List[int]) -> Iterator[Tuple[str, str]]:
+        keys = self.keys
+        terms = self.terms
+        for index in indices:
+            yield keys[index], terms[index]
+
+
+class TermIndexBuilder:
+    """Accumulates term column chunks so an index can be built while a file streams in."""
+
+    def __init__(self) -> None:
+        self._values: List[np.ndarray] = []
+        self._rows: List[np.ndarray] = []
+
+    def add(self, series: pd.Series, first_row: int) -> None:
+        values = series.reset_index(drop=True).dropna().astype(str).str.strip()
+        values = values[values != ""]
+        self._values.append(values.to_numpy(dtype=object))
+        self._rows.append(values.index.to_numpy(dtype=np.int64) + first_row)
+
+    def build(self, kind: str = SEARCH_ENGINE) -> TermIndex:
+        values = pd.Series(np.concatenate(self._values) if self._values else [], dtype=object)
+        frame = pd.DataFrame(
+            {
+                "key": KEY_NORMALIZER.normalize_series(values),
+                "display": values,
+                "row": np.concatenate(self._rows) if self._rows else np.empty(0, dtype=np.int64),
+            }
+        ).sort_values(["key", "display", "row"], kind="mergesort")
+
+        display = frame["display"].to_numpy()
+        boundaries = np.ones(len(display), dtype=bool)
+        boundaries[1:] = display[1:] != display[:-1]
+        starts = np.flatnonzero(boundaries)
+        keys = frame["key"].to_numpy()[starts].tolist()
+        return TermIndex(
+            terms=display[starts].tolist(),
+            keys=keys,
+            row_order=frame["row"].to_numpy(dtype=np.int64),
+            row_bounds=np.append(starts, len(display)).astype(np.int64),
+            engine=build_engine(keys, kind),
+        )
@@ -0,0 +1,82 @@
+"""Substring/whole-word latency of the term search engines at several glossary sizes.
+
+Run from the repository root::
+
+    python -m benchmarks.search_engines --sizes 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from app.search_engines import ENGINES
+
+SYLLABLES = [
+    "net", "work", "data", "ser", "ver", "rou", "ter", "cli", "ent", "pro",
+    "to", "col", "sig", "nal", "fre", "quen", "cy", "mod", "ule", "tion",
+    "lay", "er", "ca", "ble", "an", "ten", "na", "port", "ad", "dress",
+]
+
+
+def synthetic_keys(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    keys = set()
+    while len(keys) < count:
+        words = [
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        keys.add(" ".join(words))
+    return sorted(keys)
+
+
+QUERIES = {
+    "short": "ne",
+    "common": "work",
+    "medium": "routerca",
+    "rare": "quencyantenna",
+    "missing": "zzzq",
+}
+
+
+def time_query(function, needle: str, repeat: int) -> Dict[str, float]:
+    samples = []
+    hits = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        hits = len(function(needle))
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": round(statistics.median(samples), 3), "hits": hits}
+
+
+def run(sizes: List[int], repeat: int) -> List[Dict[str, object]]:
+    report = []
+    for size in sizes:
+        keys = synthetic_keys(size)
+        for name, engine_cls in ENGINES.items():
+            started = time.perf_counter()
+            engine = engine_cls(keys)
+            build_ms = (time.perf_counter() - started) * 1000
+            entry: Dict[str, object] = {"engine": name, "terms": size, "build_ms": round(build_ms, 1)}
+            for label, needle in QUERIES.items():
+                entry[f"substring_{label}"] = time_query(engine.substring, needle, repeat)
+                entry[f"whole_word_{label}"] = time_query(engine.whole_word, needle, repeat)
+            report.append(entry)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    for entry in run(args.sizes, args.repeat):
+        print(json.dumps(entry))
+
+
+if __name__ == "__main__":
+    main()
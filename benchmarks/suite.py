@@ -0,0 +1,216 @@
+"""End-to-end latency and peak memory of ingestion, search and details lookups.
+
+Generates synthetic glossaries, drives the API in-process and prints one
+JSON object per measurement so runs can be diffed or loaded into pandas.
+Run from the repository root::
+
+    python -m benchmarks.suite --rows 10000 100000 --formats csv xlsx --output bench.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote
+
+os.environ.setdefault("GLOSSARY_STORE_DIR", "")
+os.environ.setdefault("GLOSSARY_PARSE_EXECUTOR", "thread")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app import main  # noqa: E402
+from app.glossary_cache import GlossaryCache  # noqa: E402
+from app.indexing import get_index_executor  # noqa: E402
+from app.ingest import parse_glossary  # noqa: E402
+
+from .synthetic import synthetic_glossary, write_glossary  # noqa: E402
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return {
+        "samples": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(cuts[49], 3),
+        "p90_ms": round(cuts[89], 3),
+        "p99_ms": round(cuts[98], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def measure(
+    action: Callable[[], object], repeat: int, reset: Optional[Callable[[], None]] = None
+) -> Dict[str, float]:
+    """Time ``action`` ``repeat`` times, then once more under tracemalloc for its peak allocation."""
+    samples = []
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    if reset is not None:
+        reset()
+    tracemalloc.start()
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {**summarize(samples), "peak_memory_mb": round(peak / 1024 / 1024, 2)}
+
+
+def reset_glossary_cache() -> None:
+    main.GLOSSARY_CACHE = GlossaryCache()
+
+
+def checked(response):
+    response.raise_for_status()
+    return response
+
+
+def run_scale(rows: int, file_format: str, args: argparse.Namespace, workdir: Path) -> List[Dict[str, object]]:
+    frame = synthetic_glossary(
+        rows,
+        columns=args.columns,
+        term_words=args.term_words,
+        text_length=args.text_length,
+        unicode_ratio=args.unicode_ratio,
+        seed=args.seed,
+    )
+    path = write_glossary(frame, workdir, f"glossary-{rows}", file_format)
+    base = {"rows": rows, "format": file_format, "columns": args.columns, "file_bytes": path.stat().st_size}
+    results = []
+
+    def record(phase: str, stats: Dict[str, float], **extra: object) -> None:
+        entry = {**base, "phase": phase, **extra, **stats}
+        results.append(entry)
+        print(json.dumps(entry), file=sys.stderr if args.output else sys.stdout, flush=True)
+
+    record("ingest", measure(lambda: parse_glossary(path.name, str(path)), args.ingest_repeat))
+
+    client = TestClient(main.app)
+    payload = path.read_bytes()
+
+    def upload() -> None:
+        checked(client.post("/api/glossaries/upload", files=[("files", (path.name, payload))]))
+
+    def reset_upload() -> None:
+        client.cookies.clear()
+        reset_glossary_cache()
+        get_index_executor().submit(lambda: None).result()
+
+    record("upload", measure(upload, args.ingest_repeat, reset_upload))
+
+    def indexing() -> bool:
+        glossaries = checked(client.get("/api/glossaries")).json()["glossaries"]
+        return any(glossary["index_status"] == "building" for glossary in glossaries)
+
+    def upload_until_indexed() -> None:
+        upload()
+        while indexing():
+            time.sleep(0.02)
+
+    record("upload_indexed", measure(upload_until_indexed, args.ingest_repeat, reset_upload))
+
+    def reset_results() -> None:
+        if args.warm:
+            return
+        main.MATCH_CACHE.clear()
+        main.DETAILS_CACHE.clear()
+        for session in list(main.SESSION_STORE.values()):
+            session.last_query = None
+
+    rng = random.Random(args.seed)
+    terms = frame["Term"].drop_duplicates().tolist()
+    samples = [rng.choice(terms) for _ in range(args.repeat)]
+    words = [word for term in samples for word in term.split() if len(word) > 3] or samples
+    fragments = [word[1:5] for word in words]
+    typos = [term[:position] + term[position + 1 :] for term in samples for position in [len(term) // 2]]
+    cursor = {"position": 0}
+
+    def cycle(values: List[str]) -> str:
+        value = values[cursor["position"] % len(values)]
+        cursor["position"] += 1
+        return value
+
+    queries = {
+        "list_empty": lambda: {"search": ""},
+        "exact": lambda: {"search": cycle(samples), "exact": "true"},
+        "prefix": lambda: {"search": cycle(fragments)[:3], "prefix": "true"},
+        "substring": lambda: {"search": cycle(fragments)},
+        "whole_word": lambda: {"search": cycle(words), "whole_word": "true"},
+        "fuzzy": lambda: {"search": cycle(typos), "fuzzy": "true"},
+    }
+    def search(params: Callable[[], Dict[str, str]]) -> None:
+        checked(client.get("/api/terms", params=params()))
+
+    for phase, params in queries.items():
+        record(phase, measure(partial(search, params), args.repeat, reset_results))
+    record(
+        "details",
+        measure(
+            lambda: checked(client.get(f"/api/terms/details/{quote(cycle(samples), safe='')}")),
+            args.repeat,
+            reset_results,
+        ),
+    )
+    record(
+        "batch_details",
+        measure(lambda: checked(client.post("/api/terms/details", json={"terms": samples})), 3, reset_results),
+        terms=len(samples),
+    )
+    client.close()
+    main.SESSION_STORE.clear()
+    reset_glossary_cache()
+    return results
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--formats", nargs="+", choices=["csv", "xlsx"], default=["csv"])
+    parser.add_argument("--columns", type=int, default=3)
+    parser.add_argument("--term-words", type=int, default=3)
+    parser.add_argument("--text-length", type=int, default=80)
+    parser.add_argument("--unicode-ratio", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=50, help="samples per query phase")
+    parser.add_argument("--ingest-repeat", type=int, default=3, help="samples per ingestion phase")
+    parser.add_argument("--warm", action="store_true", help="keep result caches between samples")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="also write all results as JSON lines to this file")
+    args = parser.parse_args()
+
+    header = {
+        "phase": "environment",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "arguments": vars(args),
+    }
+    results: List[Dict[str, object]] = [header]
+    print(json.dumps(header), file=sys.stderr if args.output else sys.stdout, flush=True)
+    with tempfile.TemporaryDirectory(prefix="glossary-bench-") as workdir:
+        for file_format in args.formats:
+            for rows in args.rows:
+                results.extend(run_scale(rows, file_format, args, Path(workdir)))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            for entry in results:
+                handle.write(json.dumps(entry) + "\n")
+
+
+if __name__ == "__main__":
+    main_cli()
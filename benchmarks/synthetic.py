@@ -0,0 +1,79 @@
+"""Synthetic glossary generators shared by the benchmarks."""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from .search_engines import SYLLABLES
+
+UNICODE_SYLLABLES = [
+    "straße", "café", "naïve", "ångström", "œuvre", "ça", "счёт", "сеть",
+    "δίκτυο", "σήμα", "网络", "数据", "データ", "ネット", "شبكة", "רשת",
+]
+
+
+def synthetic_term(rng: random.Random, words: int, unicode_ratio: float) -> str:
+    parts = []
+    for _ in range(words):
+        pool = UNICODE_SYLLABLES if rng.random() < unicode_ratio else SYLLABLES
+        parts.append("".join(rng.choice(pool) for _ in range(rng.randint(1, 4))))
+    term = " ".join(parts)
+    return term.capitalize() if rng.random() < 0.3 else term
+
+
+def synthetic_text(rng: random.Random, length: int, unicode_ratio: float) -> str:
+    words = []
+    size = 0
+    while size < length:
+        word = synthetic_term(rng, 1, unicode_ratio)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:length]
+
+
+def synthetic_glossary(
+    rows: int,
+    columns: int = 3,
+    term_words: int = 3,
+    text_length: int = 80,
+    unicode_ratio: float = 0.1,
+    duplicate_ratio: float = 0.05,
+    seed: int = 7,
+) -> pd.DataFrame:
+    """A glossary frame: a term column followed by free-text columns.
+
+    ``duplicate_ratio`` of the rows repeat an earlier term (as real
+    termbases do with several senses per term); the last column is a
+    low-cardinality category so dictionary-encoded storage is exercised.
+    """
+    rng = random.Random(seed)
+    terms: List[str] = []
+    for _ in range(rows):
+        if terms and rng.random() < duplicate_ratio:
+            terms.append(rng.choice(terms))
+        else:
+            terms.append(synthetic_term(rng, rng.randint(1, term_words), unicode_ratio))
+    data = {"Term": terms}
+    categories = [f"Category {index}" for index in range(12)]
+    for position in range(1, columns):
+        if position == columns - 1 and columns > 2:
+            data[f"Column {position}"] = [rng.choice(categories) for _ in range(rows)]
+        else:
+            data[f"Column {position}"] = [
+                synthetic_text(rng, rng.randint(text_length // 2, text_length), unicode_ratio) for _ in range(rows)
+            ]
+    return pd.DataFrame(data)
+
+
+def write_glossary(frame: pd.DataFrame, directory: Path, name: str, file_format: str) -> Path:
+    path = directory / f"{name}.{file_format}"
+    if file_format == "csv":
+        frame.to_csv(path, index=False, encoding="utf-8")
+    elif file_format == "xlsx":
+        frame.to_excel(path, index=False, engine="openpyxl")
+    else:
+        raise ValueError(f"Unsupported format '{file_format}'.")
+    return path
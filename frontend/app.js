@@ -1,6 +1,10 @@
 const searchInput = document.querySelector("#searchInput");
 const exactMatch = document.querySelector("#exactMatch");
 const wholeWordMatch = document.querySelector("#wholeWordMatch");
+const prefixMatch = document.querySelector("#prefixMatch");
+const fuzzyMatch = document.querySelector("#fuzzyMatch");
+const rankedMatch = document.querySelector("#rankedMatch");
+const searchColumn = document.querySelector("#searchColumn");
 const glossaryCheckboxes = document.querySelector("#glossaryCheckboxes");
 const termList = document.querySelector("#termList");
 const resultArea = document.querySelector("#resultArea");
@@ -8,7 +12,22 @@ const glossaryFiles = document.querySelector("#glossaryFiles");
 const uploadButton = document.querySelector("#uploadButton");
 const statusMessage = document.querySelector("#statusMessage");
 
+const TERMS_PAGE_SIZE = 200;
+const MAX_CACHED_RESPONSES = 200;
+const INDEX_POLL_INTERVAL = 1000;
+
+// ETag and parsed body per GET URL; a 304 hands back the very same object,
+// so callers can compare identities to skip re-rendering unchanged data.
+const cachedResponses = new Map();
+
 let searchDebounce;
+let termsQuery = "";
+let nextTermsOffset = null;
+let loadingTerms = false;
+let renderedTermsPage = null;
+let renderedDetails = null;
+let detailsColumn = "";
+let indexPoll = null;
 
 function debounce(fn, wait = 250) {
   return function (...args) {
@@ -18,18 +37,58 @@ function debounce(fn, wait = 250) {
 }
 
 async function fetchJSON(url, options = {}) {
-  const response = await fetch(url, options);
+  const cacheable = !options.method || options.method === "GET";
+  const cached = cacheable ? cachedResponses.get(url) : undefined;
+  const headers = cached ? { ...options.headers, "If-None-Match": cached.etag } : options.headers;
+  const response = await fetch(url, { ...options, headers });
+  if (response.status === 304 && cached) {
+    cachedResponses.delete(url);
+    cachedResponses.set(url, cached);
+    return cached.data;
+  }
   if (!response.ok) {
     const error = await response.text();
-    throw new Error(error || "Request failed");
+    throw new Error(describeError(error) || "Request failed");
+  }
+  const data = await response.json();
+  const etag = response.headers.get("ETag");
+  if (cacheable && etag) {
+    cachedResponses.delete(url);
+    cachedResponses.set(url, { etag, data });
+    if (cachedResponses.size > MAX_CACHED_RESPONSES) {
+      cachedResponses.delete(cachedResponses.keys().next().value);
+    }
+  }
+  return data;
+}
+
+function describeError(text) {
+  try {
+    const { detail } = JSON.parse(text);
+    if (typeof detail === "string") {
+      return detail;
+    }
+    if (detail && detail.files) {
+      return `${detail.message} ${describeUploadProblems(detail.files)}`;
+    }
+  } catch (err) {
+    // Not a JSON error body; show it as is.
   }
-  return response.json();
+  return text;
+}
+
+function describeUploadProblems(files) {
+  return files
+    .filter((file) => file.status !== "loaded")
+    .map((file) => `${file.filename}: ${file.detail}`)
+    .join("; ");
 }
 
 async function refreshGlossaries() {
   try {
     const { glossaries } = await fetchJSON("/api/glossaries");
     renderGlossaries(glossaries);
+    renderColumnOptions(glossaries);
     statusMessage.textContent = `Loaded glossaries: ${glossaries.length}`;
     await refreshTerms();
   } catch (err) {
@@ -37,7 +96,26 @@ async function refreshGlossaries() {
   }
 }
 
+// Searches work while indexes are still building, only slower, so polling
+// just keeps the progress notes current.
+function scheduleIndexPoll(glossaries) {
+  clearTimeout(indexPoll);
+  if (glossaries.some((glossary) => glossary.index_status === "building")) {
+    indexPoll = setTimeout(pollIndexProgress, INDEX_POLL_INTERVAL);
+  }
+}
+
+async function pollIndexProgress() {
+  try {
+    const { glossaries } = await fetchJSON("/api/glossaries");
+    renderGlossaries(glossaries);
+  } catch (err) {
+    statusMessage.textContent = err.message;
+  }
+}
+
 function renderGlossaries(glossaries) {
+  scheduleIndexPoll(glossaries);
   glossaryCheckboxes.innerHTML = "";
   if (!glossaries.length) {
     glossaryCheckboxes.innerHTML = "<p class='empty'>No glossaries loaded yet.</p>";
@@ -66,10 +144,48 @@ function renderGlossaries(glossaries) {
       note.textContent = "Large glossary (search only)";
       wrapper.appendChild(note);
     }
+
+    if (glossary.index_status !== "ready") {
+      const note = document.createElement("span");
+      note.className = "glossary-note";
+      note.textContent =
+        glossary.index_status === "building"
+          ? `Indexing ${Math.round(glossary.index_progress * 100)}%`
+          : "Indexing failed (slower search)";
+      wrapper.appendChild(note);
+    }
+
+    const remove = document.createElement("button");
+    remove.type = "button";
+    remove.className = "glossary-remove";
+    remove.textContent = "Remove";
+    remove.dataset.id = glossary.id;
+    remove.addEventListener("click", handleGlossaryRemove);
+    wrapper.appendChild(remove);
     glossaryCheckboxes.appendChild(wrapper);
   });
 }
 
+function renderColumnOptions(glossaries) {
+  const current = searchColumn.value;
+  const columns = [];
+  glossaries.forEach((glossary) => {
+    glossary.columns.forEach((column) => {
+      if (!columns.includes(column)) {
+        columns.push(column);
+      }
+    });
+  });
+  searchColumn.innerHTML = "<option value=''>Term column</option>";
+  columns.forEach((column) => {
+    const option = document.createElement("option");
+    option.value = column;
+    option.textContent = column;
+    searchColumn.appendChild(option);
+  });
+  searchColumn.value = columns.includes(current) ? current : "";
+}
+
 async function handleGlossaryToggle(event) {
   const { id } = event.target.dataset;
   const selected = event.target.checked;
@@ -85,34 +201,93 @@ async function handleGlossaryToggle(event) {
   }
 }
 
+function fetchTermsPage(query, offset) {
+  return fetchJSON(`/api/terms?${query}&limit=${TERMS_PAGE_SIZE}&offset=${offset}`);
+}
+
+async function handleGlossaryRemove(event) {
+  event.preventDefault();
+  const { id } = event.target.dataset;
+  try {
+    await fetchJSON(`/api/glossaries/${id}`, { method: "DELETE" });
+    await refreshGlossaries();
+  } catch (err) {
+    statusMessage.textContent = err.message;
+  }
+}
+
 async function refreshTerms() {
   try {
     const params = new URLSearchParams();
     params.append("search", searchInput.value);
     params.append("exact", exactMatch.checked);
     params.append("whole_word", wholeWordMatch.checked);
-    const { terms } = await fetchJSON(`/api/terms?${params.toString()}`);
-    renderTermList(terms);
+    params.append("prefix", prefixMatch.checked);
+    params.append("fuzzy", fuzzyMatch.checked);
+    params.append("ranked", rankedMatch.checked);
+    if (searchColumn.value) {
+      params.append("column", searchColumn.value);
+    }
+    const query = params.toString();
+    termsQuery = query;
+    detailsColumn = searchColumn.value;
+    const page = await fetchTermsPage(query, 0);
+    if (query === termsQuery && page !== renderedTermsPage) {
+      renderTermList(page);
+    }
   } catch (err) {
     statusMessage.textContent = err.message;
   }
 }
 
-function renderTermList(terms) {
+async function loadMoreTerms() {
+  if (nextTermsOffset === null || loadingTerms) {
+    return;
+  }
+  loadingTerms = true;
+  const query = termsQuery;
+  try {
+    const page = await fetchTermsPage(query, nextTermsOffset);
+    if (query === termsQuery) {
+      appendTerms(page);
+    }
+  } catch (err) {
+    statusMessage.textContent = err.message;
+  } finally {
+    loadingTerms = false;
+  }
+}
+
+function renderTermList(page) {
+  renderedTermsPage = page;
   termList.innerHTML = "";
-  if (!terms.length) {
+  termList.scrollTop = 0;
+  nextTermsOffset = null;
+  if (!page.terms.length) {
     termList.innerHTML = "<li class='empty'>No terms match the current filters.</li>";
     return;
   }
+  appendTerms(page);
+}
 
-  terms.forEach((term) => {
+function appendTerms(page) {
+  const fragment = document.createDocumentFragment();
+  page.terms.forEach((term) => {
     const item = document.createElement("li");
     item.textContent = term;
     item.dataset.term = term;
-    termList.appendChild(item);
+    fragment.appendChild(item);
   });
+  termList.appendChild(fragment);
+  nextTermsOffset = page.next_offset;
 }
 
+termList.addEventListener("scroll", () => {
+  if (termList.scrollTop + termList.clientHeight >= termList.scrollHeight - 50) {
+    loadMoreTerms();
+  }
+});
+
 termList.addEventListener("click", (event) => {
   const term = event.target.dataset.term;
   if (term) {
@@ -122,14 +297,18 @@ termList.addEventListener("click", (event) => {
 
 async function fetchTermDetails(term) {
   try {
-    const data = await fetchJSON(`/api/terms/details/${encodeURIComponent(term)}`);
-    renderTermDetails(data);
+    const column = detailsColumn ? `?column=${encodeURIComponent(detailsColumn)}` : "";
+    const data = await fetchJSON(`/api/terms/details/${encodeURIComponent(term)}${column}`);
+    if (data !== renderedDetails) {
+      renderTermDetails(data);
+    }
   } catch (err) {
     statusMessage.textContent = err.message;
   }
 }
 
 function renderTermDetails(data) {
+  renderedDetails = data;
   if (!data.results.length) {
     resultArea.innerHTML = "<p class='empty'>No definition available for the selected term.</p>";
     return;
@@ -172,19 +351,22 @@ uploadButton.addEventListener("click", async () => {
   files.forEach((file) => formData.append("files", file, file.name));
 
   try {
-    await fetchJSON("/api/glossaries/upload", {
+    const report = await fetchJSON("/api/glossaries/upload", {
       method: "POST",
       body: formData,
     });
     glossaryFiles.value = "";
-    statusMessage.textContent = "Glossaries uploaded successfully.";
     await refreshGlossaries();
+    const problems = describeUploadProblems(report.files);
+    statusMessage.textContent = problems
+      ? `Glossaries uploaded with problems. ${problems}`
+      : "Glossaries uploaded successfully.";
   } catch (err) {
     statusMessage.textContent = err.message;
   }
 });
 
-[searchInput, exactMatch, wholeWordMatch].forEach((el) =>
+[searchInput, exactMatch, wholeWordMatch, prefixMatch, fuzzyMatch, rankedMatch, searchColumn].forEach((el) =>
   el.addEventListener("input", debounce(refreshTerms))
 );
 
@@ -0,0 +1,5 @@
+import os
+
+# Keep app.main from creating a glossary store and SQLite sessions in the checkout when tests import it.
+os.environ.setdefault("GLOSSARY_STORE_DIR", "")
+os.environ.setdefault("GLOSSARY_PARSE_EXECUTOR", "thread")
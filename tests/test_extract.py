@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import random
+import re
+from typing import List, Set, Tuple
+
+import pandas as pd
+import pytest
+
+from app.extract import UNSPACED_CLASS, TermMatcher
+from app.search_engines import is_unspaced
+from app.term_index import TermIndexBuilder
+
+WORDS = ["red", "apple", "app", "le", "c", "x_y", "net", "数据", "库", "ไทย", "a1"]
+PUNCTUATION = ["+", "+", "-", ".", "/", "(", ")"]
+SPACES = [" ", " ", " ", "  ", "\n", "\t", ""]
+BOUNDED_WORD = f"[^\\W{UNSPACED_CLASS}]"
+
+
+def random_terms(rng: random.Random, count: int) -> List[str]:
+    terms = set()
+    while len(terms) < count:
+        parts = [rng.choice(WORDS + PUNCTUATION) for _ in range(rng.randint(1, 3))]
+        terms.add(" ".join(parts) if rng.random() < 0.5 else "".join(parts))
+    return sorted(terms)
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    pieces = []
+    for _ in range(length):
+        piece = rng.choice(WORDS + PUNCTUATION)
+        pieces.append(piece.upper() if rng.random() < 0.2 else piece)
+        pieces.append(rng.choice(SPACES))
+    return "".join(pieces)
+
+
+def reference_hits(terms: List[str], text: str) -> Set[Tuple[str, int, int]]:
+    """One regex per term, with the word-boundary rules of whole-word search."""
+    hits = set()
+    for term in terms:
+        body = r"\s+".join(re.escape(word) for word in term.split())
+        if re.fullmatch(r"\w", term[0]) and not is_unspaced(term[0]):
+            body = f"(?<!{BOUNDED_WORD})" + body
+        if re.fullmatch(r"\w", term[-1]) and not is_unspaced(term[-1]):
+            body += f"(?!{BOUNDED_WORD})"
+        for match in re.finditer(f"(?=({body}))", text, re.IGNORECASE):
+            hits.add((term, match.start(1), match.end(1)))
+    return hits
+
+
+def build_matcher(terms: List[str]) -> TermMatcher:
+    builder = TermIndexBuilder()
+    builder.add(pd.Series(terms, dtype=object), 0)
+    return TermMatcher([("glossary", builder.build())])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_scan_matches_regex_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    terms = random_terms(rng, 60)
+    matcher = build_matcher(terms)
+    for _ in range(20):
+        text = random_text(rng, 40)
+        found = {(matcher.patterns[pattern][1], start, end) for pattern, start, end in matcher.scan(text)}
+        assert found == reference_hits(terms, text), text
+
+
+def test_scan_reports_overlapping_terms() -> None:
+    matcher = build_matcher(["red apple", "apple", "apple pie"])
+    hits = sorted((start, end) for _, start, end in matcher.scan("A red  Apple pie."))
+    assert hits == [(2, 12), (7, 12), (7, 16)]
+
+
+def test_scan_respects_word_boundaries() -> None:
+    matcher = build_matcher(["net", "c++", "数据"])
+
+    def found(text: str) -> List[Tuple[str, int, int]]:
+        return [(matcher.patterns[pattern][1], start, end) for pattern, start, end in matcher.scan(text)]
+
+    assert found("dotnet c+++ cnet") == [("c++", 7, 10)]
+    assert found("数据库") == [("数据", 0, 2)]
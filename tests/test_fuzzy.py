@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+from typing import List
+
+import pytest
+
+from app.fuzzy import MAX_EDITS, FuzzyIndex, auto_edits, bounded_distance
+
+
+def levenshtein(left: str, right: str) -> int:
+    previous = list(range(len(right) + 1))
+    for row, char in enumerate(left, 1):
+        current = [row]
+        for column, other in enumerate(right, 1):
+            substitute = previous[column - 1] + (char != other)
+            current.append(min(previous[column] + 1, current[column - 1] + 1, substitute))
+        previous = current
+    return previous[-1]
+
+
+def random_keys(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    alphabet = "abcde é数"
+    keys = {"".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9))) for _ in range(count)}
+    return sorted(keys)
+
+
+KEYS = random_keys(1500, seed=11)
+
+
+@pytest.fixture(scope="module")
+def index() -> FuzzyIndex:
+    return FuzzyIndex(KEYS)
+
+
+@pytest.mark.parametrize("max_edits", range(MAX_EDITS + 1))
+def test_search_matches_levenshtein(index: FuzzyIndex, max_edits: int) -> None:
+    rng = random.Random(max_edits)
+    needles = [rng.choice(KEYS) for _ in range(25)] + random_keys(25, seed=max_edits + 100)
+    for needle in needles:
+        expected = [position for position, key in enumerate(KEYS) if levenshtein(key, needle) <= max_edits]
+        assert index.search(needle, max_edits) == expected, needle
+
+
+def test_search_on_empty_index() -> None:
+    assert FuzzyIndex([]).search("abc", 1) == []
+
+
+def test_bounded_distance_matches_levenshtein() -> None:
+    rng = random.Random(5)
+    words = random_keys(300, seed=7)
+    for _ in range(3000):
+        left, right = rng.choice(words), rng.choice(words)
+        distance = levenshtein(left, right)
+        for limit in range(MAX_EDITS + 1):
+            assert bounded_distance(left, right, limit) == min(distance, limit + 1)
+
+
+@pytest.mark.parametrize("length, edits", [(0, 0), (2, 0), (3, 1), (5, 1), (6, 2), (40, 2)])
+def test_auto_edits(length: int, edits: int) -> None:
+    assert auto_edits(length) == edits
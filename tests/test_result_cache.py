@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from app.result_cache import ResultCache
+
+
+def test_default_weight_counts_entries() -> None:
+    cache: ResultCache[int] = ResultCache(4)
+    for key in range(6):
+        cache.put(key, key)
+    assert len(cache) == 4
+    assert cache.get(0) is None and cache.get(2) == 2
+
+
+def test_weighted_eviction_is_least_recently_used() -> None:
+    cache: ResultCache[str] = ResultCache(10, weigh=len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+    cache.put("c", "cccc")
+    assert cache.get("b") is None
+    assert cache.weight == 8
+    cache.put("d", "d" * 11)
+    assert cache.get("d") is None and cache.weight == 8
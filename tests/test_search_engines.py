@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import random
+from typing import List
+
+import pytest
+
+from app.search_engines import ENGINES, contains_whole_word, is_whole_word
+
+PIECES = ["ab", "ba", "a", "b", "abc", "c++", ".net", "数据", "库", "ไทย", "_", "-", " ", " ", "1"]
+
+
+def random_keys(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    keys = {"".join(rng.choice(PIECES) for _ in range(rng.randint(1, 6))).strip() for _ in range(count)}
+    return sorted(key for key in keys if key)
+
+
+KEYS = random_keys(2000, seed=3)
+NEEDLES = [
+    "a", "ab", "ba", "abc", "bab", "aba", "c++", ".net", "数据", "据库", "库", "ไทย", "ab ab", "a_b", "1", "zzz",
+]
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+@pytest.mark.parametrize("needle", NEEDLES)
+def test_substring_matches_brute_force(name: str, needle: str) -> None:
+    engine = ENGINES[name](KEYS)
+    assert engine.substring(needle) == [index for index, key in enumerate(KEYS) if needle in key]
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+@pytest.mark.parametrize("needle", NEEDLES)
+def test_whole_word_matches_brute_force(name: str, needle: str) -> None:
+    engine = ENGINES[name](KEYS)
+    expected = [index for index, key in enumerate(KEYS) if contains_whole_word(key, needle)]
+    assert engine.whole_word(needle) == expected
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+def test_engines_handle_empty_glossary(name: str) -> None:
+    engine = ENGINES[name]([])
+    assert engine.substring("ab") == []
+    assert engine.whole_word("abc") == []
+
+
+@pytest.mark.parametrize(
+    "text, needle, expected",
+    [
+        ("data base", "base", True),
+        ("database", "base", False),
+        ("base_line", "base", False),
+        ("use c++ here", "c++", True),
+        ("asp.net core", ".net", True),
+        ("dotnet", "net", False),
+        ("数据库", "数据", True),
+        ("abab ab", "ab", True),
+        ("ababab", "ab", False),
+    ],
+)
+def test_contains_whole_word(text: str, needle: str, expected: bool) -> None:
+    assert contains_whole_word(text, needle) is expected
+
+
+def test_is_whole_word_checks_both_edges() -> None:
+    assert is_whole_word("a cat sat", 2, 5)
+    assert not is_whole_word("a cats", 2, 5)
+    assert not is_whole_word("scat", 1, 4)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import io
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app import main
+from app.glossary_cache import glossary_memory
+from app.sessions import MemorySessionBackend, SessionBackend, SQLiteSessionBackend
+
+SESSION_ID = "0" * 8 + "-0000-0000-0000-" + "0" * 12
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> SessionBackend:
+    if request.param == "sqlite":
+        return SQLiteSessionBackend(tmp_path / "sessions.sqlite3")
+    return MemorySessionBackend()
+
+
+def manifest(*names: str) -> Dict[str, object]:
+    return {"glossaries": [{"key": name} for name in names]}
+
+
+def test_save_is_compare_and_set(backend: SessionBackend) -> None:
+    assert backend.save(SESSION_ID, manifest("a"), 0) == 1
+    assert backend.save(SESSION_ID, manifest("b"), 0) is None
+    assert backend.save(SESSION_ID, manifest("c"), 1) == 2
+    assert backend.save(SESSION_ID, manifest("d"), 1) is None
+    assert backend.revision(SESSION_ID) == 2
+    assert backend.load(SESSION_ID, max_age=60) == (2, manifest("c"))
+    assert backend.glossary_keys(max_age=60) == {"c"}
+
+
+def upload(client: TestClient, content: str, *names: str) -> None:
+    files = [
+        ("files", (f"{name}.csv", io.BytesIO(f"term\n{name} {content}\n".encode()), "text/csv")) for name in names
+    ]
+    assert client.post("/api/glossaries/upload", files=files).status_code == 200
+
+
+@pytest.fixture
+def session(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> main.SessionState:
+    monkeypatch.setattr(main, "SESSION_BACKEND", MemorySessionBackend())
+    client = TestClient(main.app)
+    upload(client, request.node.name, "first", "second")
+    return main.SESSION_STORE[client.cookies["glossary_session_id"]]
+
+
+Change = Callable[[Tuple[main.Glossary, ...]], Iterable[main.Glossary]]
+
+
+def deselect(name: str) -> Change:
+    def change(glossaries: Tuple[main.Glossary, ...]) -> Iterable[main.Glossary]:
+        return [replace(g, selected=False) if g.display_name == name else g for g in glossaries]
+
+    return change
+
+
+def selection(glossaries: Iterable[main.Glossary]) -> List[Tuple[str, bool]]:
+    return [(glossary.display_name, glossary.selected) for glossary in glossaries]
+
+
+def test_persist_applies_change_to_resynced_session(session: main.SessionState) -> None:
+    stale_revision = session.revision
+    record = main.SESSION_BACKEND.load(session.id, max_age=60)
+    assert record is not None
+    other = {"glossaries": [dict(entry) for entry in record[1]["glossaries"]]}
+    other["glossaries"][1]["selected"] = False
+    assert main.SESSION_BACKEND.save(session.id, other, stale_revision) == stale_revision + 1
+
+    saved = main.persist_session(session, deselect("first.csv"))
+
+    assert saved is not session
+    assert main.SESSION_STORE[session.id] is saved
+    assert saved.revision == stale_revision + 2
+    assert selection(saved.glossaries) == [("first.csv", False), ("second.csv", False)]
+    assert selection(session.glossaries) == [("first.csv", True), ("second.csv", True)]
+    assert [glossary.shared.references for glossary in saved.glossaries] == [1, 1]
+    stored = main.SESSION_BACKEND.load(session.id, max_age=60)
+    assert stored is not None and [entry["selected"] for entry in stored[1]["glossaries"]] == [False, False]
+
+
+def test_persist_gives_up_after_repeated_conflicts(
+    session: main.SessionState, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    attempts = []
+
+    def conflicting_save(session_id: str, manifest: Dict[str, object], expected_revision: int) -> None:
+        attempts.append(expected_revision)
+        return None
+
+    monkeypatch.setattr(main.SESSION_BACKEND, "save", conflicting_save)
+    with pytest.raises(HTTPException) as raised:
+        main.persist_session(session, deselect("first.csv"))
+
+    assert raised.value.status_code == 409
+    assert len(attempts) == main.SESSION_SAVE_ATTEMPTS
+    assert selection(main.SESSION_STORE[session.id].glossaries) == [("first.csv", True), ("second.csv", True)]
+
+
+def test_first_fuzzy_search_counts_fuzzy_index_memory(session: main.SessionState) -> None:
+    glossary = session.glossaries[0]
+    shared = glossary.shared
+    index = shared.column_indexes[0]
+    assert index is not None and not index.has_fuzzy
+    before = shared.memory_bytes
+    main.collect_matches([glossary], "frist", "fuzzy")
+    assert index.has_fuzzy
+    assert shared.memory_bytes == glossary_memory(shared.table, shared.column_indexes) > before
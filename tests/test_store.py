@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+import pytest
+
+from app import store as store_module
+from app.indexing import build_column_index, column_values
+from app.ingest import build_parsed_glossary
+from app.normalization import KeyNormalizer
+from app.search_engines import ScanEngine, TrigramEngine
+from app.store import GlossaryStore
+from app.table import DictionaryColumn, GlossaryTable, StringColumn
+from app.term_index import MODE_PREFIX, MODE_SUBSTRING, MODE_WHOLE_WORD, TermIndex, TermIndexBuilder
+
+KEY = "ab" + "0" * 62
+
+
+def sample_table() -> GlossaryTable:
+    rows = 300
+    frame = pd.DataFrame(
+        {
+            "term": [f"Term {index % 120} café" for index in range(rows)],
+            "status": ["approved" if index % 3 else "draft" for index in range(rows)],
+            "note": [None if index % 7 == 0 else f"note {index} 数据" for index in range(rows)],
+        }
+    )
+    return build_parsed_glossary([frame]).table
+
+
+def assert_same_index(loaded: Optional[TermIndex], original: TermIndex) -> None:
+    assert loaded is not None
+    assert loaded.terms == original.terms
+    assert loaded.keys == original.keys
+    assert loaded.row_order.tolist() == original.row_order.tolist()
+    assert loaded.row_bounds.tolist() == original.row_bounds.tolist()
+    assert type(loaded.engine) is type(original.engine)
+    queries = [("term 1", MODE_PREFIX), ("caf", MODE_SUBSTRING), ("café", MODE_WHOLE_WORD), ("", MODE_SUBSTRING)]
+    for needle, mode in queries:
+        assert loaded.search(needle, mode) == original.search(needle, mode)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    table = sample_table()
+    term_index = TermIndexBuilder()
+    term_index.add(pd.Series(column_values(table.column(0)), dtype=object), 0)
+    indexes: List[Optional[TermIndex]] = [term_index.build(kind="trigram"), None, None]
+    store = GlossaryStore(tmp_path)
+
+    assert not store.has_glossary(KEY)
+    assert store.load_glossary(KEY) is None
+    store.save_glossary(KEY, table, indexes, size_bytes=1234)
+    assert store.has_glossary(KEY)
+
+    loaded = store.load_glossary(KEY)
+    assert loaded is not None
+    loaded_table, loaded_indexes, size = loaded
+    assert size == 1234
+    assert loaded_table.columns == table.columns
+    assert loaded_table.row_count == table.row_count
+    assert [type(loaded_table.column(i)) for i in range(3)] == [type(table.column(i)) for i in range(3)]
+    assert isinstance(table.column(1), DictionaryColumn) and isinstance(table.column(2), StringColumn)
+    for position in range(len(table.columns)):
+        assert column_values(loaded_table.column(position)) == column_values(table.column(position))
+    assert_same_index(loaded_indexes[0], indexes[0])
+    assert loaded_indexes[1:] == [None, None]
+
+
+def test_save_indexes_adds_and_upgrades(tmp_path: Path) -> None:
+    table = sample_table()
+    builder = TermIndexBuilder()
+    builder.add(pd.Series(column_values(table.column(0)), dtype=object), 0)
+    scan_index = builder.build(kind="scan")
+    store = GlossaryStore(tmp_path)
+    store.save_glossary(KEY, table, [scan_index, None, None], size_bytes=1)
+
+    upgraded = scan_index.with_engine(TrigramEngine(scan_index.keys, blob=scan_index.engine.blob))
+    note_index = build_column_index(column_values(table.column(2)))
+    store.save_indexes(KEY, [upgraded, None, note_index])
+
+    loaded = store.load_glossary(KEY)
+    assert loaded is not None
+    _, loaded_indexes, _ = loaded
+    assert isinstance(loaded_indexes[0].engine, TrigramEngine)
+    assert_same_index(loaded_indexes[0], upgraded)
+    assert loaded_indexes[1] is None
+    assert_same_index(loaded_indexes[2], note_index)
+    assert not [path for path in (tmp_path / "glossaries" / KEY[:2] / KEY).iterdir() if path.name.startswith(".")]
+
+
+def test_save_indexes_keeps_indexes_with_the_same_engine(tmp_path: Path) -> None:
+    table = sample_table()
+    index = build_column_index(column_values(table.column(0)))
+    assert isinstance(index.engine, ScanEngine)
+    store = GlossaryStore(tmp_path)
+    store.save_glossary(KEY, table, [index, None, None], size_bytes=1)
+    saved = tmp_path / "glossaries" / KEY[:2] / KEY / "index0.keys.bin"
+    inode = saved.stat().st_ino
+    store.save_indexes(KEY, [index, None, None])
+    assert saved.stat().st_ino == inode
+
+
+def test_load_rejects_other_normalization(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    table = sample_table()
+    store = GlossaryStore(tmp_path)
+    store.save_glossary(KEY, table, [build_column_index(column_values(table.column(0))), None, None], 1)
+    monkeypatch.setattr(store_module, "KEY_NORMALIZER", KeyNormalizer(["casefold"]))
+    assert store.load_glossary(KEY) is None
+
+
+def test_outdated_entry_is_absent_and_replaced(tmp_path: Path) -> None:
+    table = sample_table()
+    store = GlossaryStore(tmp_path)
+    store.save_glossary(KEY, table, [None, None, None], size_bytes=1)
+    meta_path = tmp_path / "glossaries" / KEY[:2] / KEY / "meta.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta["format"] = 1
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    assert not store.has_glossary(KEY)
+    assert store.load_glossary(KEY) is None
+    store.save_glossary(KEY, table, [None, None, None], size_bytes=2)
+    assert store.has_glossary(KEY)
+    loaded = store.load_glossary(KEY)
+    assert loaded is not None and loaded[2] == 2
+    assert not [path for path in meta_path.parent.parent.iterdir() if path.name.startswith(".")]
+
+
+def test_remove_unreferenced(tmp_path: Path) -> None:
+    table = sample_table()
+    store = GlossaryStore(tmp_path)
+    kept, dropped, recent = "cd" + "1" * 62, "cd" + "2" * 62, "ef" + "3" * 62
+    for key in (kept, dropped, recent):
+        store.save_glossary(key, table, [None, None, None], size_bytes=1)
+    old = time.time() - 7200
+    for key in (kept, dropped):
+        os.utime(tmp_path / "glossaries" / key[:2] / key, (old, old))
+
+    assert store.remove_unreferenced({kept}, min_age=3600) == 1
+    assert store.has_glossary(kept) and store.has_glossary(recent)
+    assert not store.has_glossary(dropped)
+    assert not [path for path in (tmp_path / "glossaries" / "cd").iterdir() if path.name.startswith(".")]